@@ -20,41 +20,98 @@ __author__ = "PeekPy Contributors"
 __email__ = "contributors@github.com"
 __license__ = "CC0-1.0"
 
-# Import main classes for convenience
-try:
+# Helpers are imported under private names so they stay out of the package namespace
+import os as _os, sys as _sys, warnings as _warnings
+from types import MappingProxyType as _MappingProxyType
+from functools import lru_cache as _lru_cache
+from typing import TYPE_CHECKING as _TYPE_CHECKING, NamedTuple as _NamedTuple
+
+if _TYPE_CHECKING:  # eager imports for type checkers and IDEs only
     from .log import Log, ConsoleTable, ProgressBar, t2str, DebugChars
-    from .peekPy import PeekPy, ConsoleStream, HTMLStream
-    
-    __all__ = [
-        # Logging utilities
-        'Log', 'ConsoleTable', 'ProgressBar', 't2str', 'DebugChars',
-        # CSV utilities  
-        'timeParse', 'splitCSV', 'diffCSV', 'copyCSV',
-        # Code analysis
-        'PeekPy', 'ConsoleStream', 'HTMLStream',
-        'get_pattern_detector',
-    ]
-    
-except ImportError as e:
-    # Graceful degradation for missing dependencies
-    import warnings
-    if "No module named 'log'" not in str(e):  # Only warn for real issues
-        warnings.warn(f"Some modules could not be imported: {e}")
-    __all__ = []
+    from .peekPy import (PeekPy, ConsoleStream, HTMLStream,
+                         detect_get_patterns, replace_file_get_patterns, demo_patterns)
+
+# Public names are resolved lazily (PEP 562): importing the package does not
+# pull in the submodules until a name is used.
+_LAZY = {
+    # Logging utilities
+    'Log': ('.log', 'Log'),
+    'ConsoleTable': ('.log', 'ConsoleTable'),
+    'ProgressBar': ('.log', 'ProgressBar'),
+    't2str': ('.log', 't2str'),
+    'DebugChars': ('.log', 'DebugChars'),
+    # Code analysis
+    'PeekPy': ('.peekPy', 'PeekPy'),
+    'ConsoleStream': ('.peekPy', 'ConsoleStream'),
+    'HTMLStream': ('.peekPy', 'HTMLStream'),
+    'detect_get_patterns': ('.peekPy', 'detect_get_patterns'),
+    'replace_file_get_patterns': ('.peekPy', 'replace_file_get_patterns'),
+    'demo_patterns': ('.peekPy', 'demo_patterns'),
+}
+_LAZY_FAILED = set()  # submodules whose import already failed
+
+__all__ = (
+    # Logging utilities
+    'Log', 'ConsoleTable', 'ProgressBar', 't2str', 'DebugChars',
+    # Code analysis
+    'PeekPy', 'ConsoleStream', 'HTMLStream',
+    'detect_get_patterns', 'replace_file_get_patterns', 'demo_patterns',
+)
+
+def __getattr__(name):
+    """Resolve a public name from its submodule on first access."""
+    if name == 'METADATA':
+        return _metadata()
+    try:
+        module, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    if module in _LAZY_FAILED:  # already failed once, don't walk sys.path again
+        raise AttributeError(f"{name!r} is unavailable: {module[1:]} could not be imported")
+    import importlib, importlib.util
+    if importlib.util.find_spec(module, __name__) is None:  # no raise/catch needed
+        _LAZY_FAILED.add(module)
+        raise AttributeError(f"{name!r} is unavailable: {module[1:]} not found")
+    try:
+        submodule = importlib.import_module(module, __name__)
+    except ImportError as e:
+        # The submodule exists (find_spec above), so this is a real import error
+        _LAZY_FAILED.add(module)
+        _warnings.warn(f"Some modules could not be imported: {e}")
+        raise AttributeError(f"{name!r} is unavailable: {e}") from e
+    # Cache every name served by this submodule in the module namespace, so
+    # later lookups are plain attribute loads that never reach __getattr__.
+    namespace = _sys.modules[__name__].__dict__
+    for other, (other_module, other_attr) in _LAZY.items():
+        if other_module == module:
+            namespace[other] = getattr(submodule, other_attr)
+    return namespace[name]
+
+def __dir__():
+    return _DIR
 
 def get_version():
     """Return the current version of CoreMarine Utils."""
     return __version__
 
+class _Meta(_NamedTuple):
+    name: str
+    version: str
+    author: str
+    email: str
+    license: str
+    description: str
+
+# Package information is constant, so bundle it once and serve read-only views.
+# The dunder constants above stay literal because setup.py parses __version__.
+_META = _Meta('PeekPy', __version__, __author__, __email__, __license__,
+              'Hierarchical console logging utilities for Python')
+_INFO = _MappingProxyType({key: getattr(_META, key)
+                          for key in ('name', 'version', 'author', 'license', 'description')})
+
 def get_info():
-    """Return package information."""
-    return {
-        'name': 'PeekPy',
-        'version': __version__,
-        'author': __author__,
-        'license': __license__,
-        'description': 'Hierarchical console logging utilities for Python'
-    }
+    """Return package information (read-only mapping)."""
+    return _INFO
 
 def setup_logging(style='minimal', debug_level=0):
     """
@@ -67,32 +124,42 @@ def setup_logging(style='minimal', debug_level=0):
     Returns:
         Log: Configured logger instance
     """
-    try:
-        log = Log()
-        log.set_style(style)
-        log.set_debug_level(debug_level)
-        return log
-    except NameError:
-        raise ImportError("Log class not available. Check dependencies.")
-
-# Package metadata for setup.py
-METADATA = {
-    'name': 'peekpy',
-    'version': __version__,
-    'description': 'Hierarchical console logging utilities for Python',
-    'long_description': __doc__,
-    'author': __author__,
-    'author_email': __email__,
-    'license': __license__,
-    'python_requires': '>=3.8',
-    'install_requires': [
-        'numpy>=1.20.0',
-        'pandas>=1.3.0',
-    ],
-    'extras_require': {
-        'full': [
-            'pygments>=2.10.0',
-            'matplotlib>=3.3.0',
-        ]
+    from .log import Log
+    log = Log()
+    log.set_style(style)
+    log.set_debug_level(debug_level)
+    return log
+
+# Packaging metadata lives in setup.py; this copy is only kept for callers
+# that still read PeekPy.METADATA, and is built on first access.
+@_lru_cache(maxsize=None)
+def _metadata():
+    return {
+        'name': _META.name.lower(),
+        'version': _META.version,
+        'description': _META.description,
+        # __doc__ is stripped under python -OO
+        'long_description': __doc__ if __doc__ is not None else _META.description,
+        'author': _META.author,
+        'author_email': _META.email,
+        'license': _META.license,
+        'python_requires': '>=3.8',
+        'install_requires': [],
+        'extras_require': {
+            'full': [
+                'pygments>=2.10.0',
+                'matplotlib>=3.3.0',
+            ]
+        }
     }
-}
+
+# Module listing for dir()/tab completion: the public names only, computed
+# once the namespace is final.
+_DIR = tuple(sorted({name for name in globals() if not name.startswith('_')}
+                    | set(_LAZY) | {'METADATA', '__version__', '__author__', '__email__', '__license__'}))
+
+# Set PEEKPY_EAGER_IMPORT=1 (e.g. in CI) to resolve every lazy name up front
+# so broken deferred imports surface at import time.
+if _os.environ.get('PEEKPY_EAGER_IMPORT'):
+    for _name in _LAZY:
+        getattr(_sys.modules[__name__], _name)
@@ -1,11 +1,140 @@
 # -=--==-=--==-=--==-=--== Logging Utility -=--==-=--==-=--==-=--==
-import time as tm, numpy as np
-import re, os, shutil, pathlib
-from typing import List, Dict, Optional, Union, Tuple
+import time as tm
+import re, os, sys, io, random, atexit, array, textwrap, threading
+from typing import List, Dict, Optional, Union, Tuple, NamedTuple
 from math import floor
+from itertools import zip_longest, accumulate
+from collections import defaultdict
+from functools import lru_cache
+from types import MappingProxyType
 n_indent = 0
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Console Output
+# ─────────────────────────────────────────────────────────────────────────────
+class _BufferState(threading.local):
+    """Per-thread pending output of a _LogBuffer and its ``with`` nesting."""
+    def __init__(self):
+        self.parts: List[str]   = []
+        self.size: int          = 0
+        self.depth: int         = 0     # nesting of active ``with`` blocks
+
+class _LogBuffer:
+    """
+    Write buffer in front of *stdout*.
+
+    Text written outside a ``with _console:`` block is flushed right away, so
+    single log lines still appear immediately. Inside the block, writes are
+    collected and handed to *stdout* as one write when the outermost block
+    exits (or once *limit* characters have piled up). Blocks are per thread:
+    only the thread inside one has its output held back.
+    """
+    def __init__(self, limit: int = 8 * io.DEFAULT_BUFFER_SIZE):
+        self.limit: int     = limit
+        self._state         = _BufferState()
+        self._lock          = threading.RLock()  # serializes depth changes and stream writes
+
+    def write(self, text: str):
+        state = self._state
+        if not state.depth:
+            self._emit(text)
+            return
+        state.parts.append(text)
+        state.size += len(text)
+        if state.size >= self.limit:
+            self.flush()
+
+    def flush(self):
+        """Write out what the calling thread has pending."""
+        state = self._state
+        if state.parts:
+            parts, state.parts = state.parts, []
+            state.size = 0
+            self._emit("".join(parts))
+
+    def _emit(self, text: str):
+        with self._lock:
+            stream = sys.stdout     # looked up late so redirection keeps working
+            stream.write(text)
+            stream.flush()
+
+    def __enter__(self):
+        with self._lock:
+            self._state.depth += 1
+        return self
+
+    def __exit__(self, *exc):
+        with self._lock:
+            state = self._state
+            state.depth -= 1
+            if not state.depth:
+                self.flush()
+        return False
+
+_console = _LogBuffer()
+atexit.register(_console.flush)
+
+# ANSI escape codes and accent symbols for Log.header
+_BOLD           = '\033[1m'
+_BRIGHT_CYAN    = '\033[96m'
+_BRIGHT_YELLOW  = '\033[93m'
+_BRIGHT_MAGENTA = '\033[95m'
+_RESET          = '\033[0m'
+_DIM            = '\033[2m'
+
+class _Palette(NamedTuple):
+    """The escape codes Log.header colors with; all empty when color is off."""
+    bold: str
+    cyan: str
+    yellow: str
+    magenta: str
+    reset: str
+    dim: str
+
+_COLORS    = _Palette(_BOLD, _BRIGHT_CYAN, _BRIGHT_YELLOW, _BRIGHT_MAGENTA, _RESET, _DIM)
+_NO_COLORS = _Palette("", "", "", "", "", "")
+
+def _use_color() -> bool:
+    """Color only for an interactive stdout, and never when NO_COLOR is set."""
+    if os.environ.get("NO_COLOR"):
+        return False
+    try:
+        return sys.stdout.isatty()
+    except (AttributeError, ValueError):  # replaced or closed stream
+        return False
+_HEADER_SYMBOLS = "∫∑∇∆∂αβγδθλμπσφω⚡⚙⌬◊◈◇"
+# Markers Log.list picks from for style="custom"
+_CUSTOM_MARKERS = ("•", "▪", "▫", "‣", "⁃")
+# Log.list markers that never depend on the item (other styles are resolved per item)
+_STATIC_MARKERS = {"arrow": "→", "dash": "─"}
+_ROMAN_MARKERS  = ("i.", "ii.", "iii.", "iv.", "v.", "vi.", "vii.", "viii.", "ix.", "x.")
+
+# Log.list value classes ("key: value" items): group names and color-code markers
+_TYPE_GROUPS  = {"num": "Numbers", "bool": "Booleans", "str": "Strings"}
+_TYPE_MARKERS = {"num": "▲", "bool": "◆", "str": "●"}   # ▲ numbers, ◆ booleans, ● strings
+
+def _classify(value: str) -> str:
+    """Classify a list value as "num", "bool" or "str" in one scan.
+
+    Numbers are digits with any '.' or '-' mixed in; booleans are true/false
+    in any case.
+    """
+    value = value.strip()
+    has_digit = False
+    for c in value:
+        if c.isdigit():
+            has_digit = True
+        elif c != "." and c != "-":
+            break
+    else:
+        if has_digit:
+            return "num"
+    if len(value) in (4, 5) and value.lower() in ("true", "false"):
+        return "bool"
+    return "str"
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Debug Characters
 # ─────────────────────────────────────────────────────────────────────────────
@@ -415,9 +544,17 @@ class DebugChars:
         'degree': '°',             # °
         }   
         # Top border
-        
+
+    # Status name -> indicator, resolved once for status_indicator()
+    _INDICATORS = {
+        'success': STATUS['heavy_check'],
+        'error': STATUS['heavy_cross'],
+        'warning': STATUS['warning'],
+        'info': STATUS['info']
+    }
     
     @classmethod
+    @lru_cache(maxsize=128)
     def create_separator(cls, char=None, length=80, style='double'):
         """
         Create a horizontal separator line.
@@ -431,7 +568,7 @@ class DebugChars:
             str: Separator line
         """
         if char is None:
-            char = getattr(cls, style.upper(), cls.DOUBLE)['horizontal']
+            char = _BOX[_BOX_STYLE_IDS.get(style.lower(), _BOX_DOUBLE)][_HORIZONTAL]
         return char * length
     
     @classmethod
@@ -446,7 +583,7 @@ class DebugChars:
         Returns:
             str: Formatted text with arrows
         """
-        arrow = cls.ARROWS.get(arrow_style, cls.ARROWS['double_right'])
+        arrow = _ARROWS.get(arrow_style) or _DEFAULT_ARROW
         return f"{arrow} {text}"
     
     @classmethod
@@ -461,15 +598,208 @@ class DebugChars:
         Returns:
             str: Text with status indicator
         """
-        indicators = {
-            'success': cls.STATUS['heavy_check'],
-            'error': cls.STATUS['heavy_cross'],
-            'warning': cls.STATUS['warning'],
-            'info': cls.STATUS['info']
-        }
-        indicator = indicators.get(status, cls.STATUS['info'])
+        indicator = _INDICATORS.get(status) or _DEFAULT_INDICATOR
         return f"{indicator} {text}"
 
+# Read-only module-level views of the categories the helpers above use, so
+# each call is one dict lookup instead of a class attribute walk plus lookup
+_ARROWS             = MappingProxyType(DebugChars.ARROWS)
+_INDICATORS         = MappingProxyType(DebugChars._INDICATORS)
+_DEFAULT_ARROW      = DebugChars.ARROWS['double_right']
+_DEFAULT_INDICATOR  = DebugChars._INDICATORS['info']
+
+# Box-drawing sets flattened to _BOX[style_id][role_id]; rounded is the
+# single-line set with rounded corners
+_BOX_ROLES = ('horizontal', 'vertical', 'top_left', 'top_right', 'bottom_left',
+              'bottom_right', 'cross', 'tee_up', 'tee_down', 'tee_left', 'tee_right')
+_HORIZONTAL = _BOX_ROLES.index('horizontal')
+_BOX = tuple(tuple(chars[role] for role in _BOX_ROLES)
+             for chars in (DebugChars.SINGLE, DebugChars.DOUBLE, DebugChars.HEAVY,
+                           {**DebugChars.SINGLE, **DebugChars.ROUNDED}))
+_BOX_STYLE_IDS = MappingProxyType({'single': 0, 'double': 1, 'heavy': 2, 'rounded': 3})
+_BOX_DOUBLE = _BOX_STYLE_IDS['double']
+
+# Drops the leading zero of exponents in one pass: 1.5e+03 -> 1.5e3, 2e-05 -> 2e-5
+_EXP_FIXUP = re.compile(r"e(?:\+|(-))0")
+
+# Unbound padding methods, so per-cell rendering skips the attribute lookup
+_STR_CENTER = str.center
+_STR_LJUST  = str.ljust
+_STR_RJUST  = str.rjust
+
+@lru_cache(maxsize=256)
+def _hline(n: int, ch: str = '─') -> str:
+    """Horizontal rule of n characters, shared by every table and progress bar."""
+    return ch * n
+
+@lru_cache(maxsize=256)
+def _spaces(n: int) -> str:
+    """Run of n blanks, for padding empty cells."""
+    return " " * n
+
+@lru_cache(maxsize=None)
+def _level_prefixes(level: int) -> Tuple[str, str, str]:
+    """Log prefix for an indentation level, plus its [:-1] and [:-2] trims.
+
+    Level 0 = "\n  ", level 1 = "\n │", level 2 = "\n │ │", etc. Levels are
+    bounded by Log.n_buffer, so the cache stays small and is shared by all logs.
+    """
+    prefix = "\n" + " │" * level if level else "\n  "
+    return prefix, prefix[:-1], prefix[:-2]
+
+@lru_cache(maxsize=256)
+def _type_suffix(t: type) -> str:
+    """Type suffix like ' (int)' for tree nodes with show_types, shared by all trees."""
+    return f" ({t.__name__})"
+
+# Tree node kinds: exact builtin types resolve with one dict lookup, and only
+# other types (subclasses, custom objects) fall back to isinstance checks
+_NODE_DICT, _NODE_SEQ, _NODE_LEAF = 0, 1, 2
+_NODE_KINDS = {dict: _NODE_DICT, list: _NODE_SEQ, tuple: _NODE_SEQ,
+               str: _NODE_LEAF, int: _NODE_LEAF, float: _NODE_LEAF,
+               bool: _NODE_LEAF, type(None): _NODE_LEAF}
+
+def _node_kind(value) -> int:
+    """How a tree renders value: as a dict, a list/tuple, or a leaf."""
+    kind = _NODE_KINDS.get(type(value))
+    if kind is None:
+        kind = (_NODE_DICT if isinstance(value, dict)
+                else _NODE_SEQ if isinstance(value, (list, tuple)) else _NODE_LEAF)
+    return kind
+
+def _tree_lines(out: List[str], data, level_indent: str, base_indent: str,
+                depth: int, max_depth: Optional[int], show_types: bool):
+    """Append the single-column tree lines of data (a dict, list or tuple) to out.
+
+    Pure string building with no console access, so Log._tree_recursive can
+    emit the whole tree at once.
+    """
+    # Stop if we've reached max depth
+    if max_depth is not None and depth > max_depth:     return
+    # No data or empty container
+    if not data:    return
+    
+    append = out.append
+    # Process each item
+    items = list(data.items() if _node_kind(data) == _NODE_DICT else enumerate(data))
+    last_idx = len(items) - 1
+    lead = level_indent + base_indent
+    
+    for i, (key, value) in enumerate(items):
+        # Determine if this is the last item at this level
+        is_last = i == last_idx
+        
+        # Choose the right branch character based on position
+        branch = " ╰─" if is_last else ("╰┬" if i == 0 else " ├─")
+        
+        # Create next level's connector
+        next_connector = "   " if is_last else " │ "
+        
+        kind = _node_kind(value)
+        # Handle nested dictionary
+        if kind == _NODE_DICT and value:
+            type_info = _type_suffix(type(value)) if show_types else ""
+            append(f"{lead}{branch}◻ {key}{type_info}")
+            
+            # Recursively process nested data
+            _tree_lines(out, value, level_indent, base_indent + next_connector,
+                        depth + 1, max_depth, show_types)
+        
+        # Handle list/array
+        elif kind == _NODE_SEQ and value:
+            type_info = _type_suffix(type(value)) if show_types else ""
+            append(f"{lead}{branch} {key}{type_info}:")
+            
+            # Process list items
+            item_lead = lead + next_connector
+            last_j = len(value) - 1
+            for j, item in enumerate(value):
+                item_type = _type_suffix(type(item)) if show_types else ""
+                append(f"{item_lead}{' ╰─' if j == last_j else ' ├─'} {item}{item_type}")
+        
+        # Handle leaf node
+        else:
+            type_info = _type_suffix(type(value)) if show_types else ""
+            append(f"{lead}{branch} {key}: {value}{type_info}")
+
+def _wrap_spaces(text: str, width: int) -> List[str]:
+    """textwrap.wrap(text, width, break_long_words=False, break_on_hyphens=False)
+    for text whose only whitespace is plain spaces.
+
+    Breaks are found by slicing at the last space that fits (str.rfind), in one
+    pass and without splitting the text into words first.
+    """
+    lines = []
+    append = lines.append
+    rest = text
+    while len(rest) > width:
+        cut = rest.rfind(" ", 0, width + 1)
+        if cut < 0:     # first word too long: keep it whole
+            cut = rest.find(" ", width)
+            if cut < 0:
+                break
+        line = rest[:cut].rstrip(" ")
+        if line:        # a break inside leading blanks yields no line
+            append(line)
+        rest = rest[cut + 1:].lstrip(" ")
+    rest = rest.rstrip(" ")
+    if rest:
+        append(rest)
+    return lines
+
+@lru_cache(maxsize=32)
+def _banner_tmpl(total_width: int, c: _Palette) -> Tuple[str, str, str, str]:
+    """Fixed pieces of a Log.header banner: top edge, side opener and closer, blank row.
+
+    Only the ornament row, the title row and the bottom edge vary per call.
+    """
+    side_open = f"{c.yellow}│{c.reset}"
+    side_close = f"{c.yellow}│{c.reset}\n"
+    top = f"\n{c.yellow}╭{_hline(total_width - 2)}╮{c.reset}\n"
+    blank = f"{side_open}{c.dim}{_spaces(total_width - 2)}{c.reset}{side_close}"
+    return top, side_open, side_close, blank
+
+# Log.list item indents (items hang off the header, or plain) with the
+# first-item lead-in and the footer derived from each, built once
+_LIST_HEADER_SEP = "⚙"
+_LIST_INDENTS = {
+    indent_items: (indent, f"{indent[:-8]}    ╰─┬", f"{indent[:-1]}╰───────────")
+    for indent_items, indent in ((True, _spaces(len(_LIST_HEADER_SEP) + 5) + "├"),
+                                 (False, _spaces(3)))
+}
+
+@lru_cache(maxsize=256)
+def _group_widths(item_widths: Tuple[int, ...], max_cols: int,
+                  available_width: int) -> Tuple[Tuple[int, ...], ...]:
+    """Greedy row grouping behind TreeRenderer._compute_grouping (see there)."""
+    if not item_widths:
+        return ()
+    groups = []
+    append = groups.append
+    padding_per_col = 1  # Space between columns
+
+    # The first item always opens a group; later items join it while
+    # they fit (plus padding) and the group has room for another column
+    current_group = [item_widths[0]]
+    current_width = item_widths[0]
+    n_cols = 1
+    for item_width in item_widths[1:]:
+        total_width = current_width + padding_per_col + item_width
+        if total_width <= available_width and n_cols < max_cols:  # Add to current group
+            current_group.append(item_width)
+            current_width = total_width
+            n_cols += 1
+        else:  # Save the current group, start a new one
+            append(tuple(current_group))
+            current_group = [item_width]
+            current_width = item_width
+            n_cols = 1
+
+    # Add the last group
+    append(tuple(current_group))
+
+    return tuple(groups)
+
 class ConsoleTable:
     def __init__(self,
                  headers: list,
@@ -491,7 +821,6 @@ class ConsoleTable:
         if log is None:
             log = Log()
         self.log: Log = log
-        log.blank()
         # define headers and formats
         self.headers: list = headers
         self.formats: list = formats if formats else ['{}'] * len(headers)
@@ -507,20 +836,27 @@ class ConsoleTable:
 
         # Calculate widths based on headers
         self.min_width: int = 5  # Minimum width for each column
-        self.col_widths: list    = [max(self.min_width, len(header))
-                                       for header in headers]
+        hdr_lens = list(map(len, headers))
+        self.col_widths: list    = [w if w >= self.min_width else self.min_width
+                                       for w in hdr_lens]
         self.rows:          list    = []
 
         self.width = None
+        # Leading blank line, emitted with the headers; compact tables skip it
+        self._blank_pending: bool = not compact
         if compact:
             # If compact mode is enabled, use a single space as padding
             self.sep = " "
             self.margin = "│"
             # Substitute every space in headers for underbars _
             self.headers = [header.replace(" ", "_") for header in self.headers]
-            # Print headers immediately when the table is initialized   
-            self.__print_headers(header)
-        else:
+        self._margin_r: str = self.margin[::-1]   # closing margin, reversed once
+        # Row layout only depends on the column count, separator and margin:
+        # build it once, rows just fill in their centered cells
+        self._row_template = (self.margin + self.sep.join(["{}"] * len(self.headers))
+                              + self._margin_r)
+        # Print headers immediately when the table is initialized
+        with _console:
             self.__print_headers(header)
     def add_row(self, *args):
         """ As input, accepts either as many positional arguments as there are headers"""
@@ -531,12 +867,14 @@ class ConsoleTable:
             raise ValueError("Row length does not match the number of headers.")
 
         # Format the row values and calculate widths
-        row = [self.formats[i].format(item).replace('e+0', 'e').replace('e-0', 'e-') for i, item in enumerate(row)]
+        row = [_EXP_FIXUP.sub(r"e\1", fmt.format(item)) for fmt, item in zip(self.formats, row)]
 
-        # Update column widths if necessary
-        self.col_widths = [max(self.col_widths[i], len(row[i]), self.min_width)
-                           for i in range(len(row))
-        ]
+        # Grow column widths in place if necessary (they already respect
+        # min_width); once the table settles this is a plain scan
+        widths = self.col_widths
+        for i, cell in enumerate(row):
+            if len(cell) > widths[i]:
+                widths[i] = len(cell)
 
         # Store the formatted row (if needed later)
         self.rows.append(row)
@@ -545,7 +883,8 @@ class ConsoleTable:
         self.__print_row(row)
     def close(self):
         """ Closes the table by printing a closing line."""
-        self.log(f"╰{'─'*(self.width - 2)}╯").blank()
+        with _console:
+            self.log(f"╰{_hline(self.width - 2)}╯").blank()
         return self
     # private methods
     def __add_padding(self, side: str = "right") -> str:
@@ -557,28 +896,31 @@ class ConsoleTable:
             self.headers = [pad + header for header in self.headers]
         elif side == "both":
             self.headers = [pad + header + pad for header in self.headers]
-        self.col_widths: list    = [max(len(header), self.min_width)
-                                       for header in self.headers]
+        self.col_widths: list    = [w if w >= self.min_width else self.min_width
+                                       for w in map(len, self.headers)]
 
     def __print_headers(self, header: str):
         """Prints the headers of the table."""
-        cols_str    = self.sep.join(header.center(self.col_widths[i])
-                                 for i, header in enumerate(self.headers))
-        cols_str    = self.margin + cols_str + self.margin[::-1]
+        widths      = self.col_widths
+        cols_str    = self._row_template.format(*map(_STR_CENTER, self.headers, widths))
         self.width  = len(cols_str)
 
         line_len     = self.width - (len(header) + 4)
-        line         = np.random.choice(self.log.lines_sep)[:line_len//2]        
+        line         = random.choice(self.log.lines_sep)[:line_len//2]        
         header_str  = f"╭{line} {header} {line}╮"
-        blank_str   = f"│{' '*(self.width-2)}│"
-        
+        blank_str   = f"│{_spaces(self.width - 2)}│"
+
+        if self._blank_pending:
+            self._blank_pending = False
+            self.log.blank()
         self.log(header_str).log(blank_str).log(cols_str)
     def __print_row(self, row):
         """
         Prints a single row of data with the appropriate spacing.
         :param row: The row of formatted data to print
         """
-        self.log(self.margin + self.sep.join(str(item).center(self.col_widths[i]) for i, item in enumerate(row)) + self.margin[::-1])
+        template, widths = self._row_template, self.col_widths
+        self.log(template.format(*map(_STR_CENTER, map(str, row), widths)))
 
 class ProgressBar:
     """ A class to handle an inline progress bar using the Log instance.
@@ -589,6 +931,7 @@ class ProgressBar:
         current_bars (int): The number of bars currently printed.
         closed (bool): Whether the progress bar has been closed.
     """
+    _BAR_UNIT: str = '▄'
     def __init__(self, log: "Log", total_length: int = 60, header: str = "progress"):
         """
         Initializes the progress bar with a Log instance and total length.
@@ -602,6 +945,8 @@ class ProgressBar:
         self.current_bars = 0
         self.closed = False
         self._header_printed = header  # Track if header was printed
+        # Full-length bar built once; every segment we print is a slice of it.
+        self._bar_line = self._BAR_UNIT * self.total_length
         # Initialize the progress bar with header if requested.
         self.bars_samples = [
                             # '█', '▌', '▐', '▌', '█',
@@ -615,7 +960,7 @@ class ProgressBar:
                             # '▊', '▋', '▍', '▎', '▏', '▕',
                             # Empty bars
                             '■', '□']
-        # self.char_bar = np.random.choice(self.bars_samples, 1)[0]
+        # self.char_bar = random.choice(self.bars_samples)
         if header:
             self.header(header)
         
@@ -648,7 +993,12 @@ class ProgressBar:
         """
         if self.log.DEBUG >= self.log.level:
             n_bars = int(n_bars)
-            print('▄' * n_bars, end="")
+            if n_bars <= 0:
+                return self
+            if n_bars <= self.total_length:
+                _console.write(self._bar_line[:n_bars])
+            else:
+                _console.write(self._BAR_UNIT * n_bars)
         return self
     def header(self, title: str = "progress"):
         """
@@ -659,27 +1009,30 @@ class ProgressBar:
         """
         if self.closed:
             return
-        sep_half = ' ' * floor((self.total_length - len(title)) / 2 + 1)
-        box_top = f"╭{'─' * (self.total_length + 2)}╮"
+        self.current_bars = 0
+        if not self.log._enabled:
+            return  # the box would be discarded, don't build it
+        sep_half = _spaces(floor((self.total_length - len(title)) / 2 + 1))
+        box_top = f"╭{_hline(self.total_length + 2)}╮"
         box_len = len(box_top)
         half_title = f"│ 0%{sep_half[:-3]}{title}"
-        self.log(box_top).log(half_title + " " * (box_len - len(half_title) - 6) + "100% │")
-        
-        self.current_bars = 0
+        with _console:
+            self.log(box_top).log(half_title + _spaces(box_len - len(half_title) - 6) + "100% │")
     def close(self):
         """
         Closes the progress bar by printing any remaining bars and finishing the line.
         """
         if self.closed: return
         debug_ok = self.log.DEBUG >= self.log.level
-        if self.current_bars < self.total_length and debug_ok:
-            self.bars(self.total_length - self.current_bars)
-        self.closed = True
-        if self.log.DEBUG == 0:
-            return self
-        elif debug_ok:
-            print(" ┤", end="")
-            self.log(f"╰{'─' * (self.total_length + 2)}╯")
+        with _console:
+            if self.current_bars < self.total_length and debug_ok:
+                self.bars(self.total_length - self.current_bars)
+            self.closed = True
+            if self.log.DEBUG == 0:
+                return self
+            elif debug_ok:
+                _console.write(" ┤")
+                self.log(f"╰{_hline(self.total_length + 2)}╯")
 
     def remove(self):
         """
@@ -693,7 +1046,7 @@ class ProgressBar:
         n_lines = 2 + self.current_bars // self.total_length
         n_chars = self.total_length + 2
         # Move the cursor up and clear the lines.
-        print(f"\033[F\033[K" * n_lines, end="", flush=True)
+        _console.write("\033[F\033[K" * n_lines)
         # Reset the current bars to 0.
         self.current_bars = 0
 
@@ -704,6 +1057,7 @@ class TextBlockAssembler:
     This class provides a flexible framework for positioning text blocks in a grid-like
     layout, supporting various alignment modes and automatic content fitting.
     """
+    _ALIGN = {"left": _STR_LJUST, "right": _STR_RJUST, "center": _STR_CENTER}
     
     def __init__(self, rows: int, cols: int, col_widths: List[int] = None, 
                  default_align: str = "left", cell_padding: int = 1):
@@ -723,8 +1077,8 @@ class TextBlockAssembler:
         self.default_align = default_align
         self.cell_padding = cell_padding
         
-        # Internal grid storage: grid[row][col] = list of lines
-        self.grid = [[[] for _ in range(cols)] for _ in range(rows)]
+        # Internal grid storage, flat and row-major: grid[row * cols + col] = list of lines
+        self.grid = [[] for _ in range(rows * cols)]
         self.max_lines_per_row = [0] * rows
         
     def add_block(self, row: int, col: int, content: Union[str, List[str]], 
@@ -751,19 +1105,11 @@ class TextBlockAssembler:
         alignment = align or self.default_align
         col_width = self.col_widths[col]
         
-        aligned_lines = []
-        for line in lines:
-            if alignment == "left":
-                aligned_lines.append(line.ljust(col_width))
-            elif alignment == "right":
-                aligned_lines.append(line.rjust(col_width))
-            elif alignment == "center":
-                aligned_lines.append(line.center(col_width))
-            else:
-                aligned_lines.append(line.ljust(col_width))  # Default to left
-                
+        pad = self._ALIGN.get(alignment, _STR_LJUST)  # Default to left
+        aligned_lines = [pad(line, col_width) for line in lines]
+
         # Add to grid
-        self.grid[row][col] = aligned_lines
+        self.grid[row * self.cols + col] = aligned_lines
         
         # Update max lines for this row
         self.max_lines_per_row[row] = max(self.max_lines_per_row[row], len(aligned_lines))
@@ -776,28 +1122,16 @@ class TextBlockAssembler:
             List of strings representing the formatted output
         """
         output_lines = []
-        
-        for row in range(self.rows):
-            max_lines = self.max_lines_per_row[row]
-            
-            # For each line within this row
-            for line_idx in range(max_lines):
-                line_parts = []
-                
-                for col in range(self.cols):
-                    cell_content = self.grid[row][col]
-                    
-                    # Get the content for this line (or empty if cell has fewer lines)
-                    if line_idx < len(cell_content):
-                        content = cell_content[line_idx]
-                    else:
-                        content = " " * self.col_widths[col]
-                    
-                    line_parts.append(content)
-                
-                # Join with padding
-                padding = " " * self.cell_padding
-                output_lines.append(padding.join(line_parts))
+        blanks = [_spaces(width) for width in self.col_widths]   # filler for short cells
+        padding = _spaces(self.cell_padding)
+        
+        grid, cols = self.grid, self.cols
+        for start in range(0, self.rows * cols, cols):
+            # One output line per line of the tallest cell in this row
+            for line_parts in zip_longest(*grid[start:start + cols]):
+                output_lines.append(padding.join(
+                    blanks[col] if content is None else content
+                    for col, content in enumerate(line_parts)))
                 
         return output_lines
 
@@ -824,7 +1158,7 @@ class TreeRenderer:
             show_types: Show type information for values
             max_depth: Maximum depth to traverse
         """
-        if self.log.muted or self.log.DEBUG < self.log.level:
+        if not self.log._enabled:
             return
             # Calculate base indentation
         base_indent = "  "
@@ -838,7 +1172,11 @@ class TreeRenderer:
             
         # Choose rendering strategy
         if cols > 1 and isinstance(data, dict):
-            self._render_multi_column(data, base_indent, cols, max_depth, show_types)
+            # Flat dicts (no non-empty containers) only ever produce leaf items
+            if not any(_node_kind(v) != _NODE_LEAF and v for v in data.values()):
+                self._render_multi_column_flat(data, base_indent, cols, show_types)
+            else:
+                self._render_multi_column(data, base_indent, cols, max_depth, show_types)
         else:   self._single_column(data, base_indent, max_depth, show_types)
     
     def _render_multi_column(self, data: Dict, base_indent: str, cols: int, 
@@ -854,236 +1192,141 @@ class TreeRenderer:
         item_widths = []
         
         for key, value in items:
-            lines = self._generate_lines(key, value, show_types)
+            # Lines plus the actual width needed for this item (no truncation)
+            lines, max_width = self._generate_lines(key, value, show_types, max_depth)
             item_contents.append(lines)
-            # Calculate the actual width needed for this item (no truncation)
-            max_width = max(len(line) for line in lines) if lines else 0
             item_widths.append(max_width)
         
+        self._render_groups(base_indent, cols, item_contents, item_widths)
+
+    def _render_multi_column_flat(self, data: Dict, base_indent: str, cols: int, show_types: bool):
+        """Multi-column layout for dicts of leaves: every item is a title and one leaf line."""
+        tinfo = self._tinfo
+        item_contents = [[f" ─┬○ {key.title()}:", f" ╰─ {key}: {value}{tinfo(value, show_types)}", ""]
+                         for key, value in data.items()]
+        item_widths = [max(len(title), len(leaf)) for title, leaf, _ in item_contents]
+        self._render_groups(base_indent, cols, item_contents, item_widths)
+
+    def _render_groups(self, base_indent: str, cols: int,
+                       item_contents: List[List[str]], item_widths: List[int]):
+        """Lay out generated items in rows of up to *cols* columns and render them."""
         # PHASE 2: Smart grouping - distribute items optimally into rows
         available_width = self.terminal_width - 6  # Account for base indent and borders
         optimal_groups = self._compute_grouping(item_widths, cols, available_width)
         
         # PHASE 3: Render each group as a row
-        self._row_separator(base_indent, optimal_groups[0] if optimal_groups else [])
-        
-        for group_idx, group_widths in enumerate(optimal_groups):
+        start_idx = 0  # index of the group's first item in item_contents
+        for group_widths in optimal_groups:
             # Get the items for this group
-            start_idx = sum(len(g) for g in optimal_groups[:group_idx])
             group_items = item_contents[start_idx:start_idx + len(group_widths)]
-            
-            # Render row separator (except for first row)
-            if group_idx > 0:
-                self._row_separator(base_indent, group_widths)
+            start_idx += len(group_widths)
             
             # Pad all items in group to same height
             max_height = max(len(item) for item in group_items) if group_items else 0
             for item in group_items:
-                while len(item) < max_height:
-                    item.append("")
+                pad = max_height - len(item)
+                if pad:
+                    item.extend(("",) * pad)
             
             # Render the group content
             self._render_row(base_indent, group_items, group_widths)
-        
-        # Render bottom border
-        self._bottom_border(base_indent, optimal_groups[-1] if optimal_groups else [])
 
-    def _compute_grouping(self, item_widths: List[int], max_cols: int, available_width: int) -> List[List[int]]:
+    def _compute_grouping(self, item_widths: List[int], max_cols: int,
+                          available_width: int) -> Tuple[Tuple[int, ...], ...]:
         """
         Optimally group items into rows to maximize space usage without exceeding available width.
-        Returns list of groups, where each group is a list of column widths.
+        Returns a tuple of groups, where each group is a tuple of column widths.
+        Layouts are memoized, so re-rendering the same data skips the computation.
         """
-        groups = []
-        current_group = []
-        current_width = 0
-        padding_per_col = 1  # Space between columns
-        
-        for item_width in item_widths:
-            # Calculate width if we add this item to current group
-            needed_width = item_width
-            if current_group:  # Add padding if not the first item in group
-                needed_width += padding_per_col
-            
-            total_width = current_width + needed_width
-            
-            # Check if we can fit this item in current group
-            can_fit = (total_width <= available_width and len(current_group) < max_cols)
-            
-            if can_fit and current_group:  # Add to current group
-                current_group.append(item_width)
-                current_width = total_width
-            else:  # Start new group
-                if current_group:  # Save current group if it exists
-                    groups.append(current_group)
-                current_group = [item_width]
-                current_width = item_width
-        
-        # Add the last group
-        if current_group:
-            groups.append(current_group)
-        
-        return groups
+        return _group_widths(tuple(item_widths), max_cols, available_width)
 
     def _render_row(self, base_indent: str, group_items: List[List[str]], 
                                         group_widths: List[int]):
-        """Render row content without column separators."""
-        max_height = max(len(item) for item in group_items) if group_items else 0
-        
-        for line_idx in range(max_height):
-            line_parts = [base_indent + "  "]
-            
-            for col_idx, item_lines in enumerate(group_items):
-                if col_idx < len(group_widths):
-                    col_width = group_widths[col_idx]
-                    
-                    # Get the content for this line
-                    if line_idx < len(item_lines) and item_lines[line_idx].strip():
-                        content = item_lines[line_idx].ljust(col_width)
-                    else:
-                        content = " " * col_width
-                    
-                    line_parts.append(content)
-                    
-                    # Add spacing between columns (except for last column)
-                    if col_idx < len(group_items) - 1:
-                        line_parts.append("    ")  # 4 spaces instead of separator
-            
-            # Add closing border and render
-            line_parts.append(" ")
-            self.log.log("".join(line_parts))
-    
-    def _distribute_to_rows(self, items: List, cols: int) -> List[List]:
-        """Distribute items into rows using round-robin for balanced columns."""
-        # Calculate how many complete rows we'll have
-        items_per_row = cols
-        rows = []
-        
-        for i in range(0, len(items), items_per_row):
-            row_items = items[i:i + items_per_row]
-            rows.append(row_items)
-        
-        return rows
+        """Render row content without column separators (items are pre-padded to equal height)."""
+        # One template per row: left-justified cells, 4 spaces between columns
+        row_tpl = (base_indent + "  "
+                   + "    ".join(f"{{:<{width}}}" for width in group_widths[:len(group_items)])
+                   + " ")
+
+        for cells in zip(*group_items):
+            self.log.log(row_tpl.format(*cells))
     
     def _generate_lines(self, key: str, items: list|dict, 
-                           show_types: bool) -> List[str]:
-        """Generate tree lines for a single item."""
-        lines = []
-        connector = "  "
-        lines.append(f" ─┬○ {key.title()}:")     
-        if isinstance(items, dict) and len(items) > 1:
-            type_info = f" ({type(items).__name__})" if show_types else ""
-            
-            # Process nested items
-            sub_items = list(items.items())
-            for i, (sub_key, sub_value) in enumerate(sub_items):
-                is_last = i == len(sub_items) - 1
-                next_connector  = "  "       if is_last else "│ "
-                if isinstance(sub_items, dict) and len(items) > 1:
-                    # Nested structure                    
-                    branch          = "╰─┬○ "    if is_last else "├─┬○ "
-                    lines.append(f"{connector}{branch}{sub_key.title()}:")
-                    
-                # Handle list content
-                if isinstance(sub_value, list):
-                    for j, item in enumerate(sub_value):
-                        if j == len(sub_value) - 1:
-                            branch = "  ╰─ "
-                        elif (j == 0):
-                            branch = "╰─┬─ "                            
-                        else:
-                            branch = "  ├─ "
-                        
-                        lines.append(f"{connector}{next_connector}{branch}{item}")
+                           show_types: bool, max_depth: int = None) -> Tuple[List[str], int]:
+        """Generate tree lines for a single item, along with the widest line's length.
 
-                else:
+        The item is depth 0, its entries depth 1 and so on. Nested containers
+        are walked with an explicit stack; those whose entries lie past
+        *max_depth* are shown collapsed as "…".
+        """
+        lines = [f" ─┬○ {key.title()}:"]
+        append = lines.append
+        tinfo = self._tinfo
+        kind = _node_kind(items)
+        if kind != _NODE_LEAF and items and max_depth is not None and max_depth < 1:
+            append(f" ╰─ {key}: …")
+        elif (kind == _NODE_DICT and len(items) > 1) or (kind == _NODE_SEQ and items):
+            # Branch glyphs below carry the item's two-space connector already
+            stack = []
+            if kind == _NODE_DICT:
+                self._push_entries(stack, items, "  ", 1, "╰─┬─ ", True, show_types)
+            else:
+                self._push_entries(stack, items, " ", 1, " ╰┬─ ", False, show_types)
+            while stack:
+                sub_key, value, lead, depth, branch, is_last, in_dict, types = stack.pop()
+                sub_kind = _node_kind(value)
+                if sub_kind == _NODE_LEAF or not value:
                     # Leaf node
-                    if i == 0:
-                        branch = "╰─┬─ "
-                    elif i == len(sub_items) - 1:
-                        branch = "  ╰─ "
+                    if in_dict:
+                        append(f"{lead}{branch}{sub_key} = {value}{tinfo(value, types)}")
                     else:
-                        branch = "  ├─ "
-                    type_info_leaf = f" ({type(sub_value).__name__})" if show_types else ""
-                    lines.append(f"{connector}{branch}{sub_key} = {sub_value}{type_info_leaf}")
-        
-        elif isinstance(items, (list, tuple)) and items:
-            # Process list items
-            display_items = items
-            for j, item in enumerate(display_items):
-                is_last = j == len(display_items) - 1
-                # Leaf node
-                is_first = (j == 0)
-                if is_last:
-                    branch = " ╰─ "
-                elif is_first:
-                    branch = "╰┬─ "                
+                        append(f"{lead}{branch}{value}{tinfo(value, types)}")
+                    continue
+                label = f"{sub_key}{tinfo(value, types)}" if in_dict else f"[{sub_key}]"
+                if max_depth is not None and depth >= max_depth:
+                    append(f"{lead}{branch}{label}: …")
+                elif depth == 1 and in_dict and isinstance(value, list):
+                    # Lists under the item's keys hang their items straight off the key
+                    self._push_entries(stack, value, "    " if is_last else "  │ ", 2,
+                                       "╰─┬─ ", False, False)
                 else:
-                    branch = " ├─ "
-                item_type = f" ({type(item).__name__})" if show_types else ""
-                lines.append(f"{connector}{branch}{item}{item_type}")
-            
-        
-        # Handle leaf node
+                    append(f"{lead}{branch}{label}:")
+                    self._push_entries(stack, value, lead + ("     " if is_last else "  │  "),
+                                       depth + 1, "╰─┬─ ", False, show_types)
         else:
-            type_info = f" ({type(items).__name__})" if show_types else ""
-            lines.append(f" ╰─ {key}: {items}{type_info}")
-            is_last = True
+            # Handle leaf node
+            append(f" ╰─ {key}: {items}{tinfo(items, show_types)}")
+        append("")
+        return lines, max(map(len, lines))
+
+    @staticmethod
+    def _push_entries(stack: list, data, lead: str, depth: int, first: str,
+                      first_wins: bool, types: bool):
+        """Push the entries of container *data* onto *stack*, last entry first.
+
+        Each entry carries its line lead and branch glyph; *first* is the glyph
+        of the first entry, used for a lone entry too when *first_wins* is set.
+        """
+        in_dict = _node_kind(data) == _NODE_DICT
+        entries = list(data.items() if in_dict else enumerate(data))
+        last = len(entries) - 1
+        for i in range(last, -1, -1):
+            sub_key, value = entries[i]
+            if i == 0 and (first_wins or last):
+                branch = first
+            else:
+                branch = "  ╰─ " if i == last else "  ├─ "
+            stack.append((sub_key, value, lead, depth, branch, i == last, in_dict, types))
+
+    def _tinfo(self, value, show_types: bool) -> str:
+        """Type suffix for a value, formatted once per type."""
+        return _type_suffix(type(value)) if show_types else ""
 
-        if is_last:
-            lines.append("")
-        
-        return lines
-    
-    def _compute_widths(self, max_widths: List[int], cols: int) -> List[int]:
-        """Calculate optimal column widths based on content and terminal size."""
-        if not max_widths:
-            return []
-            
-        # Account for borders and separators: base_indent(2) + "  │"(3) + separators + "│"(1)
-        border_overhead = 6  # Total border characters
-        separator_overhead = (len(max_widths) - 1) if len(max_widths) > 1 else 0  # │ between columns
-        available_width = self.terminal_width - border_overhead - separator_overhead
-        
-        # Add minimal padding to each column
-        padded_widths = [w + 2 for w in max_widths]  # Just 2 chars padding per column
-        total_content_width = sum(padded_widths)
-        
-        if total_content_width <= available_width:
-            # Use content-based widths with padding
-            return [max(self.min_col_width, w) for w in padded_widths]
-        else:
-            # Scale proportionally to fit terminal
-            scale_factor = available_width / total_content_width
-            return [max(self.min_col_width, int(w * scale_factor)) for w in padded_widths]
-    
-    def _row_separator(self, base_indent: str, col_widths: List[int]):
-        """Render separator line between rows without column separators."""
-        if not col_widths:
-            return
-            
-        sep_parts = [base_indent + "  ├─"]
-        # connector = DebugChars.SINGLE['tee_down']
-        connector = "○"
-        # sep_parts.append(connector + "─"*10)
-        # sep_parts.extend([" " * (col_widths[i - 1] + 3 - 12) + "─"*2 + connector + "─" * 10 for i in range(1, len(col_widths))])
-        
-        # self.log("".join(sep_parts))
-    
     def _single_column(self, data, base_indent: str, max_depth: int, show_types: bool):
         """Render traditional single-column tree (delegates to existing method)."""
         # This would use the existing _tree_recursive logic
         self.log._tree_recursive(data, base_indent, " ", "", False, 0, max_depth, show_types)
     
-    def _bottom_border(self, base_indent: str, col_widths: List[int]):
-        """Render bottom border for multi-column layout without column separators."""
-        if not col_widths:  return
-            
-        # border_parts = [base_indent + "  ╰"]
-        # total_content_width = sum(col_widths) + (len(col_widths) - 1) * 4  # 4 spaces between columns
-        # border_parts.append("─" * total_content_width)
-        # border_parts.append("╯")        
-        # self.log.log("".join(border_parts))
-    
 class Log:
     """Lightweight hierarchical logger with indented console output.
 
@@ -1103,19 +1346,22 @@ class Log:
         # - Ring buffers track state for each level (size = n_buffer)
         # ═══════════════════════════════════════════════════════════════════
         
-        self.DEBUG: int = 0                    # output visibility threshold  
-        self.level: int = 0                    # current nesting/indentation level
+        self._debug: int = 0                   # output visibility threshold (see DEBUG)
+        self._level: int = 0                   # current nesting/indentation level (see level)
         
 
         # runtime house‑keeping
         self.logpath:   str     = logpath
         self.n_buffer:  int     = n_buffer    # max nesting depth (ring buffer size)
-        self.prefix:    str     = "\n  "      # visual indentation string (updated by _set_level)
+        # visual indentation string (updated by _set_level), and the same minus
+        # its last one / two chars (for up/down/warning)
+        self.prefix, self._prefix_m1, self._prefix_m2 = _level_prefixes(0)
         self.softflag:  bool    = False
-        self.cumline:   str     = None
+        self.cumparts:  Optional[List[str]] = None  # pending itemize line fragments
+        self.cumlen:    int     = 0           # running length of cumparts
 
         # time + header ring buffers (indexed by level)
-        self._time_level:    List[float]     = [0.0] * n_buffer    # start time for each level
+        self._time_level:    array.array     = array.array('d', [0.0]) * n_buffer  # start time for each level (unboxed doubles)
         self._header_level:  List[str]       = [None] * n_buffer # header text for each level
 
         # history log (for performance analysis)
@@ -1123,21 +1369,26 @@ class Log:
         self._timelog:   Dict[str, List[float]]  = {}  # header -> [call_count, total_time]
 
         # special control mechanisms
-        self.muted: bool = False               # global mute flag
+        self._muted: bool = False              # global mute flag (see muted)
         self._mute_level: Optional[int] = None # indent level where mute started
         self._tracking:  bool                    = False    # method tracking mode flag
-        self._skip_next:  int                    = False    # level to skip (for conditional suppression)
+        self._skip_next:  int                    = 0        # skip counter, 0 = inactive (for conditional suppression)
         
+        # cached "not muted and DEBUG >= level", kept current by _refresh_enabled
+        self._enabled: bool = True
+        # ANSI colors, checked once: plain text when piped or with NO_COLOR
+        self._colors: _Palette = _COLORS if _use_color() else _NO_COLORS
+
         # ascii‑art separators
         self.set_style("minimal")  # default style
     def __call__(self, msg: str):
         """Log a message at the current indentation level."""
-        if self.muted or self.DEBUG < self.level:
+        if not self._enabled:
             return self
         if self.softflag:
             self.softflag = False
             self.addItem(None)
-        print(f"{self.prefix} {msg}", end="", flush=True)
+        _console.write(f"{self.prefix} {msg}")
         return self
     
     # ─────────────────────────────────────────────────────── up & down ──
@@ -1172,16 +1423,16 @@ class Log:
         # Case 1: DEBUG >= new level (full verbose mode)
         if self.DEBUG >= self.level:
             if header != None:  # Only show if meaningful header
-                rnd_start = np.random.choice(self.separators)[:40]
-                rnd_end = np.random.choice(self.separators)[:10]
-                decorated_header = f"{self.prefix[:-2]}{self.prefix[:-1]}◻ {rnd_start} {header} {rnd_end}"
+                rnd_start = random.choice(self._sep_heads)
+                rnd_end = random.choice(self._sep_tails)
+                decorated_header = f"{self._prefix_m2}{self._prefix_m1}◻ {rnd_start} {header} {rnd_end}"
                 # Truncate to prevent overly long lines (75 char limit)
-                print(decorated_header[:min(75, len(decorated_header))], end="", flush=True)
+                _console.write(decorated_header[:min(75, len(decorated_header))])
             
         # Case 2: DEBUG == new_level-1
         elif self.DEBUG == self.level - 1:
             if header != None:  # Only show if meaningful header
-                print(f"{self.prefix[:-1]}{header}... ", end="", flush=True)
+                _console.write(f"{self._prefix_m1}{header}... ")
         return self
     def down(self, exit_msg: Union[str, bool] = False):
         """Decrease indentation level and display scope completion with timing.
@@ -1196,14 +1447,13 @@ class Log:
         """
         # Handle skip mechanism: if skip was set for the level above current,
         # clear the skip flag and bypass this down() call
-        if self._skip_next != False:
+        if self._skip_next:
             self._skip_next -= 1
             if self._skip_next == 1:
-                self._skip_next = False
+                self._skip_next = 0
                 return self
-            elif self._skip_next == 0:
-                # self.warning("down() was called after skip().")
-                self._skip_next = False
+            # elif not self._skip_next:
+            #     self.warning("down() was called after skip().")
             
         if self.level == 0:
             self.warning(f"down() called from level 0 with header '{self._header_level[0]}'. Previous headers: {self._header_level}")
@@ -1224,7 +1474,7 @@ class Log:
             self._timelog[header][0] += 1      # Increment call count
             self._timelog[header][1] += t_span # Add elapsed time
         
-        current_prefix = str(self.prefix)  # Save current prefix for output alignment
+        current_prefix_m1 = self._prefix_m1  # Save current prefix for output alignment
         # Decrement the indentation level (handles bounds checking)
         
         self._set_level(self.level - 1)
@@ -1236,18 +1486,19 @@ class Log:
         if self.DEBUG > self.level:
             # Only show closure if the scope had a meaningful header
             if header != None:
-                rnd_end = np.random.choice(self.sep_ends)
+                rnd_end = random.choice(self.sep_ends)
                 
                 # Default exit message if none provided
                 if exit_msg is False:
                     exit_msg = "───"
                 
-                # Close any active itemized list before printing scope end
-                self.addItem(None)
-                
-                # Print scope completion using ORIGINAL level's prefix for proper alignment
-                print(f"{current_prefix[:-1]}◻{self.lines_sep[0][:20]} {exit_msg} {rnd_end}  • {t2str(t_span)}", end="", flush=True)
-                self.blank()  # Add a blank line after the closure for readability
+                with _console:
+                    # Close any active itemized list before printing scope end
+                    self.addItem(None)
+                    
+                    # Print scope completion using ORIGINAL level's prefix for proper alignment
+                    _console.write(f"{current_prefix_m1}◻{self.lines_sep[0][:20]} {exit_msg} {rnd_end}  • {t2str(t_span)}")
+                    self.blank()  # Add a blank line after the closure for readability
         
         # Case 2: DEBUG == new_level (minimal mode - complete the None message)
         # Show inline completion for the scope that was opened with "header..."
@@ -1279,13 +1530,42 @@ class Log:
             log("msg")      # This shows normally at the incremented level
             log.down()      # Level decrements, but no completion message shown
         """
-        if self._skip_next == False:
+        if not self._skip_next:
             # Record the current level where skip was requested
             self._skip_next = 1
         # else:
         #     self.warning("skip() already set, ignoring.")
         return self
     
+    # ───────────────────────────────────────────────── output gate ──
+    @property
+    def DEBUG(self) -> int:
+        """Visibility threshold: levels above it are not printed."""
+        return self._debug
+    @DEBUG.setter
+    def DEBUG(self, value: int):
+        self._debug = value
+        self._refresh_enabled()
+    @property
+    def muted(self) -> bool:
+        """Global mute flag."""
+        return self._muted
+    @muted.setter
+    def muted(self, value: bool):
+        self._muted = value
+        self._refresh_enabled()
+    @property
+    def level(self) -> int:
+        """Current nesting/indentation level."""
+        return self._level
+    @level.setter
+    def level(self, value: int):
+        self._level = value
+        self._refresh_enabled()
+    def _refresh_enabled(self):
+        """Recompute the cached output gate after DEBUG, muted or level change."""
+        self._enabled = not self._muted and self._debug >= self._level
+
     # ──────────────────────────────────────────────── mute / un‑mute ──
     def mute(self):
         """Silence all output until :py:meth:`unmute` is called."""
@@ -1322,8 +1602,7 @@ class Log:
         self.level = min(new_level, self.n_buffer - 1)
         
         # Update visual prefix: base "\n  " + vertical bars for each indentation level
-        # Example: level 0 = "\n  ", level 1 = "\n   │", level 2 = "\n   │ │", etc.
-        self.prefix = "\n" + " │" * self.level if self.level else "\n  "
+        self.prefix, self._prefix_m1, self._prefix_m2 = _level_prefixes(self.level)
         return self
     def set_level(self, new_level: int): # public wrapper kept for compatibility
         return self._set_level(new_level)
@@ -1378,6 +1657,9 @@ class Log:
             self.lines_sep = ['────────────────────────────────────────────']
         else:
             raise ValueError(f"Unknown style: {style}. Available styles: 'reinassance', 'minimal'.")
+        # Separator slices used by up(), cut once per style instead of per call
+        self._sep_heads = [sep[:40] for sep in self.separators]
+        self._sep_tails = [sep[:10] for sep in self.separators]
         return self
     def set_debug_level(self, level: int):
         self.DEBUG = max(level, -1)
@@ -1391,22 +1673,43 @@ class Log:
 
     # ──────────────────────────────────────────────── logging api ──
     def log(self, message: str):
+        if not self._enabled:
+            return self
         if self.softflag:
             self.softflag = False
             self.blank()
         self._streamConsole(f"{self.prefix} {message}")
         
         return self
+    def _log_lines(self, lines: List[str]):
+        """Log several messages at the current level with a single console write."""
+        if not self._enabled or not lines:
+            return self
+        if self.softflag:
+            self.softflag = False
+            self.blank()
+        lead = f"{self.prefix} "
+        _console.write(lead + lead.join(lines))
+        return self
+    def lazy(self, fmt: str, *args, **kwargs):
+        """Log ``fmt.format(*args, **kwargs)``, formatting only if it will be shown.
+
+        Use it for messages that are costly to build (big reprs, joins...)
+        at levels that are usually silenced.
+        """
+        if self._enabled:
+            self.log(fmt.format(*args, **kwargs))
+        return self
     def warning(self, message: str):
         if self.DEBUG >= self.level:
             self(f"⚠️ {message}")
         else:
             tree_str = "/".join([str(header) for header in self._header_level[:self.level + 1]]) + "/"
-            print(f"\n{self.prefix[:-1]} in {tree_str}:"
-                  f"\n{self.prefix[:-1]} ─────> ⚠️ {message}")
+            _console.write(f"\n{self._prefix_m1} in {tree_str}:"
+                           f"\n{self._prefix_m1} ─────> ⚠️ {message}\n")
         return self
     def softlog(self, message: str):
-        if self.muted or self.DEBUG < self.level:
+        if not self._enabled:
             return self
         if self.softflag:
             self._streamConsole(f"{self.prefix}{message}")
@@ -1418,57 +1721,50 @@ class Log:
     # ───────────────────────────────────────────── misc loggers ──
     def header(self, header: str):
         """Prints a decorated header of somewhat bigger size, and resets level to 0."""
-        if self.muted or self.DEBUG < self.level:
+        if not self._enabled:
             return self
         
         # Reset to root level for headers
         self._set_level(0)
         
-        # ANSI escape codes for enhanced aesthetics
-        BOLD = '\033[1m'
-        BRIGHT_CYAN = '\033[96m'
-        BRIGHT_YELLOW = '\033[93m'
-        BRIGHT_MAGENTA = '\033[95m'
-        RESET = '\033[0m'
-        DIM = '\033[2m'
-        
         # Create dynamic separators using existing patterns
         header_len = len(header)
         total_width = max(80, header_len + 20)
         
         # Top ornamental border with random separator
-        top_sep = np.random.choice(self.separators) if hasattr(self, 'separators') else "═══════════"
+        top_sep = random.choice(self.separators)
         top_border = (top_sep * 3)[:total_width]
         
         # Create side ornaments
         left_ornament = "▓▒░"
         right_ornament = "░▒▓"
         
-        # Mathematical/technical symbols for extra flair
-        symbols = "∫∑∇∆∂αβγδθλμπσφω⚡⚙⌬◊◈◇"
-        accent_symbol = np.random.choice(list(symbols))
+        # Mathematical/technical symbol for extra flair
+        accent_symbol = random.choice(_HEADER_SYMBOLS)
         
         # Main header construction with Unicode art
-        padding = (total_width - header_len - 8) // 2
-        center_line = f"▓▒░{' ' * padding}{accent_symbol} {BOLD}{BRIGHT_CYAN}{header.upper()}{RESET} {accent_symbol}{' ' * padding}░▒▓"
+        pad = _spaces((total_width - header_len - 8) // 2)
+        c = self._colors
+        center_line = f"▓▒░{pad}{accent_symbol} {c.bold}{c.cyan}{header.upper()}{c.reset} {accent_symbol}{pad}░▒▓"
         
         # Bottom border with different pattern
-        bottom_sep = np.random.choice(self.sep_ends) if hasattr(self, 'sep_ends') else "─────"
-        bottom_pattern = f"╰─{bottom_sep}{'─' * (total_width - len(bottom_sep) - 4)}{bottom_sep[::-1]}─╯"
+        bottom_sep = random.choice(self.sep_ends)
+        bottom_pattern = f"╰─{bottom_sep}{_hline(total_width - len(bottom_sep) - 4)}{bottom_sep[::-1]}─╯"
         
         # Assemble the complete header
-        print(f"\n{BRIGHT_YELLOW}╭{'─' * (total_width - 2)}╮{RESET}")
-        print(f"{BRIGHT_YELLOW}│{RESET}{BRIGHT_MAGENTA}{top_border[:total_width-2]}{RESET}{BRIGHT_YELLOW}│{RESET}")
-        print(f"{BRIGHT_YELLOW}│{RESET}{center_line[:total_width-2]}{BRIGHT_YELLOW}│{RESET}")
-        print(f"{BRIGHT_YELLOW}│{RESET}{DIM}{' ' * (total_width-2)}{RESET}{BRIGHT_YELLOW}│{RESET}")
-        print(f"{BRIGHT_YELLOW}{bottom_pattern}{RESET}")
-        print(f"{DIM}   ◊ TransFusion Multi-Sensor Data Fusion System ◊{RESET}\n", flush=True)
+        top, side_open, side_close, blank = _banner_tmpl(total_width, c)
+        _console.write(f"{top}"
+                       f"{side_open}{c.magenta}{top_border[:total_width-2]}{c.reset}{side_close}"
+                       f"{side_open}{center_line[:total_width-2]}{side_close}"
+                       f"{blank}"
+                       f"{c.yellow}{bottom_pattern}{c.reset}\n"
+                       f"{c.dim}   ◊ TransFusion Multi-Sensor Data Fusion System ◊{c.reset}\n\n")
         
         return self
         
     def inline(self, message: str):
-        if not self.muted and self.DEBUG >= self.level:
-            print(f" {message}", end="", flush=True)
+        if self._enabled:
+            _console.write(f" {message}")
         return self
     
     def blank(self):
@@ -1477,48 +1773,53 @@ class Log:
         return self
     def hline(self, title: str = None, len: int = 50):
         """Print a horizontal line with an optional title."""
-        if not self.muted and self.DEBUG >= self.level:
+        if self._enabled:
             if title is None:
-                self(f"   {np.random.choice(self.lines_sep)[:len]}")
+                self(f"   {random.choice(self.lines_sep)[:len]}")
             else:
-                sep1 = np.random.choice(self.lines_sep)[:20]
-                sep2 = np.random.choice(self.lines_sep)[:20]
+                sep1 = random.choice(self.lines_sep)[:20]
+                sep2 = random.choice(self.lines_sep)[:20]
                 self(f"   {sep1[::-1]} {title} {sep2}")
         return self
     
     
     def itemize(self, items: Union[List, Dict], header: str = "items", n_wrap: int = 50):
-        if not self.muted and self.DEBUG >= self.level:
+        if self._enabled:
             if isinstance(items, dict):
                 items = [f"{k}: {v}" for k, v in items.items()]
 
-            self.addItem(header, n_wrap)
-            for it in items:
-                self.addItem(it, n_wrap)
-            self.addItem(None)
+            with _console:  # the whole block goes out as one write
+                self.addItem(header, n_wrap)
+                for it in items:
+                    self.addItem(it, n_wrap)
+                self.addItem(None)
         return self
     def addItem(self, item: Optional[str], n_wrap: int = 40):
         # Create a global variable to store the indent positions
         global n_indent
 
-        if self.muted or self.DEBUG < self.level:
+        if not self._enabled:
             return self
         if item is None:
-            if self.cumline is not None:
-                self.log(self.cumline[:-2] + "]")
-                self.cumline = None
+            if self.cumparts is not None:
+                self.cumparts[-1] = self.cumparts[-1][:-2]
+                self.cumparts.append("]")
+                self.log("".join(self.cumparts))
+                self.cumparts = None
             return self
-        if self.cumline is None:
-            self.cumline = f"• {item}: ["
-            n_indent = len(self.cumline)
+        if self.cumparts is None:
+            self.cumparts = ["• ", f"{item}", ": ["]
+            self.cumlen = n_indent = sum(map(len, self.cumparts))
             self.softflag = True
             return self
         add = f"{item}; "
-        if len(self.cumline) + len(add) > n_wrap:
-            self.log(self.cumline)
-            self.cumline = " " * n_indent + add
+        if self.cumlen + len(add) > n_wrap:
+            self.log("".join(self.cumparts))
+            self.cumparts = [_spaces(n_indent), add]
+            self.cumlen = n_indent + len(add)
         else:
-            self.cumline += add
+            self.cumparts.append(add)
+            self.cumlen += len(add)
         return self
     
     def list(self, items: Union[List, Dict], 
@@ -1550,7 +1851,7 @@ class Log:
             compact: Single-line format for short lists
             color_code: Use different markers for different value types
         """
-        if self.muted or self.DEBUG < self.level:
+        if not self._enabled:
             return self
 
         # Process items
@@ -1560,7 +1861,7 @@ class Log:
             formatted_items = []
             for k, v in items.items():
                 key_str = str(k)
-                padding = ' ' * (max_key_length - len(key_str) + 2)  # +2 for consistent spacing
+                padding = _spaces(max_key_length - len(key_str) + 2)  # +2 for consistent spacing
                 formatted_items.append(f"{key_str}:{padding}{v}")
             items = formatted_items
         
@@ -1576,15 +1877,10 @@ class Log:
         if group_by_type:
             items = self._group_items_by_type(items)
         
-        header_sep = "⚙"     
-        # header_sep = header_sep[:min(4, len(header_sep))]
-        # Calculate indentation based on current level
-        if indent_items:
-            base_indent = ""
-            item_indent = " " * (len(header_sep) + 5)+ "├"  # Indentation for items
-        else:
-            base_indent = ""
-            item_indent = " " * 3  # Default indentation for items
+        header_sep = _LIST_HEADER_SEP
+        base_indent = ""
+        # Indentation for items, first-item lead-in and footer (see _LIST_INDENTS)
+        item_indent, first_lead, footer = _LIST_INDENTS[bool(indent_items)]
 
         # Show count in header if requested
         count_suffix = f" ({len(items)} items)" if show_count else ""
@@ -1594,42 +1890,31 @@ class Log:
             self.itemize(items, header, n_wrap=max_width)
             return self
         
-        # Print header with decorative elements
+        # Header with decorative elements, then each item, then the footer;
+        # all collected first and logged with a single write
         if show_count: 
-            self.log(f"{base_indent}{header_sep} {header}: {count_suffix} elements ")
+            lines = [f"{base_indent}{header_sep} {header}: {count_suffix} elements "]
         else:
-            self.log(f"{base_indent}{header_sep} {header}:")
+            lines = [f"{base_indent}{header_sep} {header}:"]
+        append = lines.append
         
         # Process each item
         for i, item in enumerate(items):
             marker = self._get_list_marker(i, style, numbered, color_code, item)
             formatted_item = self._format_list_item(str(item), max_width, item_indent)
-            if i == 0:
-                self.log(f"{item_indent[:-8]}    ╰─┬{marker} {formatted_item}")
-            else:
-                self.log(f"{item_indent}{marker} {formatted_item}")
-        self.log(f"{item_indent[:-1]}╰───────────")
+            append(f"{item_indent if i else first_lead}{marker} {formatted_item}")
+        append(footer)
+        self._log_lines(lines)
         
         return self
     def _group_items_by_type(self, items):
         """Group items by their type and return organized list."""
-        from collections import defaultdict
         groups = defaultdict(list)
         
         for item in items:
             if isinstance(item, str) and ":" in item:
-                key, value = item.split(":", 1)
-                try:
-                    # Try to determine type from value
-                    val = value.strip()
-                    if val.replace(".", "").replace("-", "").isdigit():
-                        groups["Numbers"].append(item)
-                    elif val.lower() in ["true", "false"]:
-                        groups["Booleans"].append(item)
-                    else:
-                        groups["Strings"].append(item)
-                except:
-                    groups["Mixed"].append(item)
+                # Determine the type from the value part
+                groups[_TYPE_GROUPS[_classify(item.partition(":")[2])]].append(item)
             else:
                 groups["Items"].append(item)
         
@@ -1645,30 +1930,18 @@ class Log:
         """Generate appropriate list marker based on style and options."""
         if numbered or style == "number":
             return f"{index + 1}."
-        elif style == "roman":
-            roman_nums = ["i", "ii", "iii", "iv", "v", "vi", "vii", "viii", "ix", "x"]
-            return f"{roman_nums[min(index, 9)]}."
-        elif style == "arrow":
-            return "→"
-        elif style == "dash":
-            return "─"
-        elif color_code and isinstance(item, str) and ":" in item:
+        if style == "roman":
+            return _ROMAN_MARKERS[min(index, 9)]
+        marker = _STATIC_MARKERS.get(style)
+        if marker:
+            return marker
+        if color_code and isinstance(item, str) and ":" in item:
             # Color code based on value type
-            value = item.split(":", 1)[1].strip()
-            if value.replace(".", "").replace("-", "").isdigit():
-                return "▲"  # Numbers
-            elif value.lower() in ["true", "false"]:
-                return "◆"  # Booleans
-            else:
-                return "●"  # Strings
-        elif style == "custom":
+            return _TYPE_MARKERS[_classify(item.partition(":")[2])]
+        if style == "custom":
             # Use random separator elements for artistic effect
-            if hasattr(self, 'separators'):
-                custom_chars = ["•", "▪", "▫", "‣", "⁃"]
-                return np.random.choice(custom_chars)
-            return "•"
-        else:  # bullet (default)
-            return "•"
+            return random.choice(_CUSTOM_MARKERS)
+        return "•"  # bullet (default)
     def _format_list_item(self, item: str, max_width: int, indent: str) -> str:
         """Format individual list item with optional width wrapping."""
         if max_width is None:
@@ -1677,27 +1950,14 @@ class Log:
         if len(item) <= max_width:
             return item
         
-        # Simple word wrapping
-        words = item.split()
-        lines = []
-        current_line = []
-        current_length = 0
-        
-        for word in words:
-            if current_length + len(word) + 1 <= max_width:
-                current_line.append(word)
-                current_length += len(word) + 1
-            else:
-                if current_line:
-                    lines.append(" ".join(current_line))
-                current_line = [word]
-                current_length = len(word)
-        
-        if current_line:
-            lines.append(" ".join(current_line))
+        # Word wrapping (long words are kept whole rather than split)
+        if item.isprintable():
+            lines = _wrap_spaces(item, max_width)
+        else:   # tabs, newlines & co. need textwrap's whitespace handling
+            lines = textwrap.wrap(item, width=max_width, break_long_words=False, break_on_hyphens=False)
         
         # Join with proper indentation for continuation lines
-        continuation_indent = " " * (len(indent) + 2)
+        continuation_indent = _spaces(len(indent) + 2)
         return f"\n{continuation_indent}".join(lines)
 
     def tree(self, data: Dict, header: str = "tree", 
@@ -1712,12 +1972,14 @@ class Log:
         max_depth: Maximum depth to traverse
         cols: Number of columns for first-level categories (default: 1)
         """
-        # Use the modular TreeRenderer for cleaner, more maintainable code
-        renderer = TreeRenderer(self)
-        renderer.render_tree(data, header, cols, show_types, max_depth)
-        
-        # Add closing blank line
-        self.blank()
+        # Use the modular TreeRenderer for cleaner, more maintainable code;
+        # the whole tree goes out as a single write
+        with _console:
+            renderer = TreeRenderer(self)
+            renderer.render_tree(data, header, cols, show_types, max_depth)
+            
+            # Add closing blank line
+            self.blank()
         
         return self
     def _tree_recursive(self, data, level_indent,
@@ -1725,272 +1987,11 @@ class Log:
                         is_last_branch, depth,
                         max_depth, show_types):
         """Helper method for tree() to handle nested recursion with proper indentation."""
-        # Stop if we've reached max depth
-        if max_depth is not None and depth > max_depth:     return        
-        # No data or empty container
-        if not data:    return       
-        
-        # Calculate this level's indentation
-        this_base_indent = parent_indent + connector
-        # Process each item
-        items = list(data.items() if isinstance(data, dict) else enumerate(data))
-        last_idx = len(items) - 1
-        
-        for i, (key, value) in enumerate(items):
-            # Determine if this is the last item at this level
-            is_last = i == last_idx
-            is_first = i == 0
-
-            
-            this_indent = this_base_indent if is_first else this_base_indent
-            
-            # Choose the right branch character based on position
-            branch = " ╰─" if is_last else ("╰┬" if is_first else " ├─")
-            
-            # Create next level's connector
-            next_connector = "   " if is_last else " │ "
-            
-            # Handle nested dictionary
-            if isinstance(value, dict) and value:
-                type_info = f" ({type(value).__name__})" if show_types else ""
-                self.log(f"{level_indent}{this_indent}{branch}◻ {key}{type_info}")
-                
-                # Recursively process nested data
-                self._tree_recursive(value, level_indent, this_indent, 
-                                  next_connector, is_last, depth + 1, 
-                                  max_depth, show_types)
-            
-            # Handle list/array
-            elif isinstance(value, (list, tuple)) and value:
-                type_info = f" ({type(value).__name__})" if show_types else ""
-                self.log(f"{level_indent}{this_indent}{branch} {key}{type_info}:")
-                
-                # Process list items
-                for j, item in enumerate(value):
-                    item_is_last = j == len(value) - 1
-                    item_branch = " ╰─" if item_is_last else " ├─"
-                    item_type = f" ({type(item).__name__})" if show_types else ""
-                    self.log(f"{level_indent}{this_indent}{next_connector}{item_branch} {item}{item_type}")
-            
-            # Handle leaf node
-            else:
-                type_info = f" ({type(value).__name__})" if show_types else ""
-                self.log(f"{level_indent}{this_indent}{branch} {key}: {value}{type_info}")
-    def _tree_multi_column(self, data, cols, max_depth, show_types):
-        """
-        Handle multi-column layout for first-level categories using TextBlockAssembler.
-        """
-        items = list(data.items())
-        
-        # Calculate column distribution
-        items_per_col = len(items) // cols
-        if len(items) % cols > 0:
-            items_per_col += 1
-        
-        # Calculate column distribution - use round-robin for better balance
-        columns = [[] for _ in range(cols)]
-        for i, item in enumerate(items):
-            col_idx = i % cols  # Round-robin distribution
-            columns[col_idx].append(item)
-        
-        # PRE-ANALYSIS PHASE: Generate all column content first to calculate proper dimensions
-        column_content = []
-        max_column_lines = 0
-        max_column_widths = []
-        
-        for col_idx, col_items in enumerate(columns):
-            lines = []
-            max_line_width = 0
-            
-            for i, (key, value) in enumerate(col_items):
-                is_first_in_col = i == 0
-                
-                # Generate the tree lines for this item
-                item_lines = self._generate_tree_lines(key, value, max_depth, show_types, 
-                                                     is_first_in_col, col_idx)
-                lines.extend(item_lines)
-                
-                # Track maximum line width for this column
-                for line in item_lines:
-                    max_line_width = max(max_line_width, len(line))
-                
-                # Add spacing between items (except for last item)
-                if i < len(col_items) - 1:
-                    lines.append("")
-            
-            column_content.append(lines)
-            max_column_lines = max(max_column_lines, len(lines))
-            max_column_widths.append(max_line_width + 4)  # Add padding
-        
-        # Calculate proper column widths based on content analysis
-        terminal_width = 80  # Standard terminal width
-        available_width = terminal_width - len(self.base_indent) - 2  # Account for margins
-        
-        # Distribute width proportionally, but ensure minimum column width
-        total_content_width = sum(max_column_widths)
-        min_col_width = 15  # Minimum readable column width
-        
-        if total_content_width <= available_width:
-            # Use content-based widths with balanced padding
-            col_widths = []
-            for w in max_column_widths:
-                if w > 0:
-                    col_widths.append(max(min_col_width, w + 3))
-                else:
-                    col_widths.append(0)
-        else:
-            # Scale down proportionally if content is too wide
-            scale_factor = available_width / total_content_width
-            col_widths = []
-            for w in max_column_widths:
-                if w > 0:
-                    col_widths.append(max(min_col_width, int(w * scale_factor)))
-                else:
-                    col_widths.append(0)
-        
-        line = self.setp_line(col_widths)
-        
-        
-        
-        
-        # Pad all columns to same height
-        for lines in column_content:
-            while len(lines) < max_column_lines:
-                lines.append("")
-        
-        # Output the columns line by line, properly aligned with calculated widths
-        for line_idx in range(max_column_lines):
-            line_parts = [self.base_indent + "   │"]  # Start with base indentation
-            
-            for col_idx, content in enumerate(column_content):
-                if col_idx < len(col_widths) and col_widths[col_idx] > 0:
-                    if line_idx < len(content) and content[line_idx].strip():
-                        # Format the content to fit the calculated column width
-                        formatted_content = content[line_idx].ljust(col_widths[col_idx])
-                        line_parts.append(formatted_content)
-                    else:
-                        # Empty content for this line
-                        line_parts.append(" " * col_widths[col_idx])
-            
-            # Join and output the line (remove extra empty line issue)
-            complete_line = "".join(line_parts).rstrip()
-            if complete_line.strip():  # Only output truly non-empty lines
-                self(complete_line)
-    def setp_line(self, col_widths: List[int]):        
-        # Create column separators line with proper widths
-        sep_parts = []
-        for i in range(len(col_widths)):
-            if col_widths[i] > 0:  # Only add separator if column has content
-                if i == 0:
-                    sep_parts.append("╰┬──┬" + "─" * (col_widths[i] - 4))
-                elif i == len(col_widths) - 1:
-                    sep_parts.append("┬" + "─" * 3)
-                else:
-                    sep_parts.append("┬" + "─" * col_widths[i])
-        # Only show separator if we have multiple columns with content
-        if len([w for w in col_widths if w > 0]) > 1:
-            self(f"{self.base_indent}  {''.join(sep_parts)}")
-    def _generate_tree_lines(self, key, value, max_depth, show_types, is_first_in_col, col_idx):
-        """
-        Generate tree lines for a single key-value pair in multi-column layout.
-        """
+        # The traversal only builds strings (see _tree_lines); they are
+        # logged together at the end
         lines = []
-        
-        # Handle nested dictionary
-        if isinstance(value, dict) and value:
-            type_info = f" ({type(value).__name__})" if show_types else ""
-            
-            # First line with the category name
-            lines.append(f"  ╰─◻ {key}{type_info}")
-            
-            # Process nested items
-            sub_items = list(value.items())
-            for i, (sub_key, sub_value) in enumerate(sub_items):
-                is_last = i == len(sub_items) - 1
-                
-                if isinstance(sub_value, (dict, list, tuple)) and sub_value:
-                    # Nested structure
-                    if is_first_in_col and col_idx == 0:
-                        connector = "      "
-                        branch = "╰┬ " if is_last else "├┬ "
-                    elif is_first_in_col:
-                        connector = "    "
-                        branch = "╰┬ " if is_last else "├┬ "
-                    else:
-                        connector = "    "
-                        branch = "╰┬ " if is_last else "├┬ "
-                    
-                    lines.append(f"{connector}{branch}{sub_key}")
-                    
-                    # Handle list content specially
-                    if isinstance(sub_value, list):
-                        display_items = sub_value[:3]  # Show first 3 items
-                        for j, item in enumerate(display_items):
-                            is_item_last = j == len(display_items) - 1 and len(sub_value) <= 3
-                            item_branch = "╰─ " if is_item_last else "├─ "
-                            next_connector = "     " if is_last else " │   "
-                            lines.append(f"{connector}{next_connector}{item_branch}{item}")
-                        
-                        if len(sub_value) > 3:
-                            next_connector = "     " if is_last else " │   "
-                            lines.append(f"{connector}{next_connector}╰─ ... and {len(sub_value) - 3} more")
-                else:
-                    # Leaf node
-                    if is_first_in_col and col_idx == 0:
-                        connector = "   │   "
-                        branch = "╰─ " if is_last else "├─ "
-                    elif is_first_in_col:
-                        connector = "    "
-                        branch = "╰─ " if is_last else "├─ "
-                    else:
-                        connector = "    "
-                        branch = "╰─ " if is_last else "├─ "
-                    
-                    type_info_leaf = f" ({type(sub_value).__name__})" if show_types else ""
-                    lines.append(f"{connector}{branch}{sub_key}: {sub_value}{type_info_leaf}")
-        
-        # Handle list/array
-        elif isinstance(value, (list, tuple)) and value:
-            count_info = f"[{len(value)} items]"
-            type_info = f" ({type(value).__name__})" if show_types else ""
-            
-            if is_first_in_col and col_idx == 0:
-                lines.append(f"  ╰┬ {key}{type_info} {count_info}")
-            elif is_first_in_col:
-                lines.append(f"╰┬ {key}{type_info} {count_info}")
-            else:
-                lines.append(f"├─ {key}{type_info} {count_info}")
-            
-            # Process list items (limit to avoid too much content)
-            display_items = value[:3]  # Limit to first 3 items
-            for j, item in enumerate(display_items):
-                item_is_last = j == len(display_items) - 1 and len(value) <= 3
-                item_branch = "╰─ " if item_is_last else "├─ "
-                if is_first_in_col and col_idx == 0:
-                    connector = "   │   "
-                elif is_first_in_col:
-                    connector = "    "
-                else:
-                    connector = "    "
-                item_type = f" ({type(item).__name__})" if show_types else ""
-                lines.append(f"{connector}{item_branch}{item}{item_type}")
-            
-            if len(value) > 3:
-                if is_first_in_col and col_idx == 0:
-                    connector = "   │   "
-                elif is_first_in_col:
-                    connector = "    "
-                else:
-                    connector = "    "
-                lines.append(f"{connector}╰─ ... and {len(value) - 3} more")
-        
-        # Handle leaf node
-        else:
-            type_info = f" ({type(value).__name__})" if show_types else ""
-            lines.append(f"  ╰─ {key}: {value}{type_info}")
-        
-        return lines
-    
+        _tree_lines(lines, data, level_indent, parent_indent + connector, depth, max_depth, show_types)
+        self._log_lines(lines)
     def consoleTable(self, headers: list, formats: list, title = "Table") -> ConsoleTable:
         """
         Create a ConsoleTable instance with the specified headers and formats.
@@ -2024,13 +2025,24 @@ class Log:
     
     # ───────────────────────────────────── low‑level console sink ──
     def _streamConsole(self, message: str, end: str = ""):
-        if self.muted:
+        if not self._enabled:
             return self
         if self.softflag and end != "\r":
             self.softflag = False
             self.addItem(None)
-        if self.DEBUG >= self.level:
-            print(message, end=end, flush=True)
+        _console.write(message + end)
+        return self
+    def batch(self) -> "_LogBuffer":
+        """Context manager that gathers all console output of its block.
+
+        Everything logged inside ``with log.batch():`` reaches *stdout* as a
+        single write when the block exits (or whenever the buffer fills up),
+        instead of one write per line. Other threads keep writing through.
+        """
+        return _console
+    def flush(self):
+        """Push this thread's pending console output to *stdout* right away."""
+        _console.flush()
         return self
 
 
@@ -2038,14 +2050,31 @@ class Log:
 # ─────────────────────────────────────────────────────────────────────────────
 # Utility
 # ─────────────────────────────────────────────────────────────────────────────
+_T2STR_UNITS = ((60, 1, "s"), (3600, 60, "m"), (24*3600, 3600, "h"),
+                 (30*24*3600, 24*3600, "d"), (365*24*3600, 30*24*3600, "mo"))
 def t2str(time_val):
     """Convert a time value to a string, reporting second, minutes, hours or days depending on the magnitude."""
-    if   time_val < 60: return f"{time_val:.1f}s"
-    elif time_val < 3600: return f"{time_val/60:.1f}m"
-    elif time_val < 24*3600: return f"{time_val/3600:.1f}h"
-    elif time_val < 30*24*3600: return f"{time_val/(24*3600):.1f}d"
-    elif time_val < 365*24*3600: return f"{time_val/(30*24*3600):.1f}mo"
-    else: return f"{time_val/(365*24*3600):.1f}y"
+    for limit, scale, unit in _T2STR_UNITS:
+        if time_val < limit:
+            break
+    else:
+        scale, unit = 365*24*3600, "y"
+    # round() to the printed tenth is exact, so the cache cannot change the text
+    # (zero is left out of it: 0.0 and -0.0 would share an entry)
+    value = round(time_val/scale, 1)
+    return _t2str_tenths(value, unit) if value else f"{value:.1f}{unit}"
+@lru_cache(maxsize=4096)
+def _t2str_tenths(value: float, unit: str) -> str:
+    """Format a t2str value already rounded to tenths; repeated spans hit the cache."""
+    return f"{value:.1f}{unit}"
+@lru_cache(maxsize=None)
+def _toggle_patterns(prefix: str) -> Tuple["re.Pattern", "re.Pattern"]:
+    """Multiline regexes for toggle(), matching lines that start with  log.<something>
+    or  ConsoleTable(  …: one for live lines, one for lines commented out with '#'.
+    Group 1 is the existing left indent in both."""
+    call = rf"(?:{re.escape(prefix)}[ \t]*\.|ConsoleTable[ \t]*\(|progressBar[ \t]*\()"
+    return (re.compile(rf"^([ \t]*)(?={call})", re.M),
+            re.compile(rf"^([ \t]*)# *(?=[ \t]*{call})", re.M))
 def toggle(script_dir: Union[str, os.PathLike],
            comment: bool = True,
            prefix : str = "log",
@@ -2073,56 +2102,60 @@ def toggle(script_dir: Union[str, os.PathLike],
     verbose : bool
         Prints a tiny report to *stdout*.
     """
+    import shutil, pathlib  # only toggle() touches files; keep them off the import path
     p_dir = pathlib.Path(script_dir)
     if p_dir.is_file() and p_dir.suffix == ".py":
         files = [p_dir]
     else:
         files = list(p_dir.rglob("*.py"))
 
-    # Regex: any line containing  log.<something>(   or   ConsoleTable(   …
-    patt = re.compile(
-        rf"""
-        (^[ \t]*)                    # 1. existing left indent
-        (                            #    start of the "interesting" chunk
-            (?:{re.escape(prefix)}\s*\.)      #   log.…
-          | ConsoleTable\s*\(                #   ConsoleTable(
-          | progressBar\s*\(                 #   progressBar(
-        ).*$
-        """, re.X)
+    live, commented = _toggle_patterns(prefix)
+    if comment:     # ── we are disabling logging: comment out after the indent ──
+        patt, repl = live, lambda m: m.group(1) + indent_comment
+    else:           # ── we are enabling logging: drop the first '#' (and spaces after it) ──
+        patt, repl = commented, r"\1"
 
     changed = 0
     for fp in files:
-        txt = fp.read_text(encoding="utf-8").splitlines(keepends=False)
-        out = []
-
-        for ln in txt:
-            m = patt.match(ln.lstrip("# ").rstrip())   # test line *without* leading comment
-            if comment:                      # ── we are disabling logging ──
-                if m and not ln.lstrip().startswith("#"):
-                    ln = m.group(1) + indent_comment + ln[len(m.group(1)):]  # keep indentation
-                    changed += 1
-            else:                            # ── we are enabling logging ──
-                if ln.lstrip().startswith("#"):
-                    core = ln.lstrip()[1:]       # remove first '#'
-                    if patt.match(core.lstrip()):
-                        # rebuild: keep left indent, drop the first '#'
-                        indent = len(ln) - len(ln.lstrip())
-                        ln = " " * indent + core.lstrip(" ")
-
-                        changed += 1
-            out.append(ln)
-
-        if changed:
+        txt = fp.read_text(encoding="utf-8")
+        new, n = patt.subn(repl, txt)
+        if n:   # untouched files are neither backed up nor rewritten
+            changed += n
             if backup:
                 shutil.copy(fp, fp.with_suffix(fp.suffix + ".bak"))
-            fp.write_text("\n".join(out) + "\n", encoding="utf-8")
+            fp.write_text(new, encoding="utf-8")
 
     if verbose:
         action = "commented" if comment else "restored"
         print(f"[toggle] {changed} lines {action} across {len(files)} file(s).")
-def validate_updown(file_path: str,
+# AST fields validate_updown never descends into: they only hold contexts/operators
+_AST_LEAF_FIELDS = frozenset({"ctx", "op", "ops"})
+# AST fields that hold nested statements (or handlers/cases wrapping them)
+_AST_BODY_FIELDS = frozenset({"body", "orelse", "finalbody", "handlers", "cases"})
+@lru_cache(maxsize=None)
+def _updown_pattern(up_name: str, down_name: str) -> "re.Pattern":
+    """Regex finding  .<up_name>  or  .<down_name>  attribute accesses, the only
+    spelling an up/down call can have; validate_updown parses no file without one."""
+    names = "|".join(map(re.escape, (up_name, down_name)))
+    return re.compile(rf"\.[ \t\r\n\\]*(?:{names})(?!\w)")
+@lru_cache(maxsize=512)
+def _read_cached(path: str, mtime_ns: int, size: int) -> str:
+    """Text of a source file for validate_updown, keyed on its mtime and size
+    so that an edited file is read again."""
+    from pathlib import Path
+    return Path(path).read_text(encoding="utf-8")
+@lru_cache(maxsize=512)
+def _parse_cached(path: str, mtime_ns: int, size: int) -> "ast.Module":
+    """AST of a source file (see _read_cached). The tree is only read, never changed."""
+    import ast
+    return ast.parse(_read_cached(path, mtime_ns, size), filename=path)
+_updown_pool = None   # thread pool shared by directory scans, created on first use
+_updown_procs = None  # process pool for validate_updown(processes=True), likewise
+                      # (both are shut down at interpreter exit)
+def validate_updown(file_path: Union[str, os.PathLike],
                                 up_name: str = "up",
-                                down_name: str = "down"
+                                down_name: str = "down",
+                                processes: bool = False
                                 ) -> List[Tuple[str, int]]:
     """
     Report every function/method whose `log.up()` / `log.down()` calls
@@ -2131,59 +2164,133 @@ def validate_updown(file_path: str,
     Parameters
     ----------
     file_path : str | Path
-        Python source file to inspect.
+        Python source file to inspect, or a directory whose *.py* files are
+        all inspected (**recursively**, several files at a time).
     up_name / down_name : str
         Attribute names to look for (override only if you renamed them).
+    processes : bool, default *False*
+        For directories: parse on a pool of worker processes, in batches of
+        files, instead of threads. Worth it for large trees, where parsing
+        (which holds the GIL) dominates; the pool is started once and reused.
 
     Returns
     -------
     list[tuple[str, int]]
         • `qualified_name`  – “Class.method” or bare function name  
+          (prefixed with “<relative/file.py>:” when scanning a directory)
         • `delta`           – **ups − downs**  
           ( +ve ≡ missing `down()`, −ve ≡ extra `down()` )
     """
+    global _updown_pool, _updown_procs
+    root = os.fspath(file_path)
+    if not os.path.isdir(root):
+        return _scan_updown(root, up_name, down_name)
+
+    import pathlib
+    files = sorted(pathlib.Path(root).rglob("*.py"))
+    paths = [os.fspath(fp) for fp in files]
+    if processes:
+        from concurrent.futures import ProcessPoolExecutor
+        if _updown_procs is None:
+            _updown_procs = ProcessPoolExecutor()
+            atexit.register(_updown_procs.shutdown)
+        # one round-trip per batch of files rather than per file
+        batches = [paths[i:i + _UPDOWN_BATCH] for i in range(0, len(paths), _UPDOWN_BATCH)]
+        scans = (found for batch in _updown_procs.map(_scan_updown_batch, batches,
+                                                      [up_name] * len(batches),
+                                                      [down_name] * len(batches))
+                 for found in batch)
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+        if _updown_pool is None:
+            _updown_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+            atexit.register(_updown_pool.shutdown)
+        # file reads overlap across threads
+        scans = _updown_pool.map(_scan_updown, paths,
+                                 [up_name] * len(paths), [down_name] * len(paths))
+    # either way results keep the sorted file order
+    return [(f"{fp.relative_to(root).as_posix()}:{qname}", delta)
+            for fp, found in zip(files, scans) for qname, delta in found]
+_UPDOWN_BATCH = 32  # files per worker-process task in validate_updown
+def _scan_updown_batch(paths: List[str], up_name: str, down_name: str) -> List[List[Tuple[str, int]]]:
+    """_scan_updown over several files, as one task for a worker process."""
+    return [_scan_updown(path, up_name, down_name) for path in paths]
+def _scan_updown(path: str, up_name: str, down_name: str) -> List[Tuple[str, int]]:
+    """validate_updown for a single source file."""
     import ast
-    from pathlib import Path
-    from typing import List, Tuple
-    src = Path(file_path).read_text(encoding="utf-8")
-    tree = ast.parse(src, filename=str(file_path))
-    report: list[tuple[str, int]] = []
-
-    class Visitor(ast.NodeVisitor):
-        def __init__(self) -> None:
-            self.cls_stack: list[str] = []
-
-        # keep track of the class we are in
-        def visit_ClassDef(self, node: ast.ClassDef):
-            self.cls_stack.append(node.name)
-            self.generic_visit(node)
-            self.cls_stack.pop()
-
-        def visit_FunctionDef(self, node: ast.FunctionDef):
-            counts = {"up": 0, "down": 0}
-
-            class CallCounter(ast.NodeVisitor):
-                def visit_Call(self, call: ast.Call):  # noqa: N802
-                    if isinstance(call.func, ast.Attribute):
-                        attr = call.func.attr
-                        if attr == up_name:
-                            counts["up"] += 1
-                        elif attr == down_name:
-                            counts["down"] += 1
-                    self.generic_visit(call)
-
-            CallCounter().visit(node)
-
-            delta = counts["up"] - counts["down"]
-            if delta:                    # record only if unbalanced
-                qname = ".".join(self.cls_stack + [node.name]) if self.cls_stack else node.name
-                report.append((qname, delta))
-
-            # still descend to nested defs
-            self.generic_visit(node)
-
-    Visitor().visit(tree)
-    return report
+    # re-scans of an unchanged file reuse its text and parsed tree
+    st = os.stat(path)
+    key = (path, st.st_mtime_ns, st.st_size)
+    src = _read_cached(*key)
+    if not _updown_pattern(up_name, down_name).search(src):
+        return []   # no call can match: skip parsing altogether
+    tree = _parse_cached(*key)
+    # offset of each line in src, for finding function bodies in the text
+    pattern = _updown_pattern(up_name, down_name)
+    line_starts = [0, *accumulate(len(line) + 1 for line in src.split("\n"))]
+    # the parser interns identifiers, so attribute names are compared by identity
+    up_name, down_name = sys.intern(up_name), sys.intern(down_name)
+    Call, Attribute, ClassDef = ast.Call, ast.Attribute, ast.ClassDef
+    functions = (ast.FunctionDef, ast.AsyncFunctionDef)
+    AST = ast.AST
+    # child fields per node type, minus the ones that only ever hold leaf
+    # markers (Load/Store contexts, operators); filled in as types show up
+    fields_of: dict = {}
+    # outside functions only nested statements matter (defs are statements),
+    # so there the walk follows just the statement-list fields
+    bodies_of: dict = {}
+    report: list = []   # [delta, node, class prefix] per function; names built at the end
+
+    # One flat depth-first loop, dispatching on the node type. Every entry
+    # carries the report slot of its innermost function (None at module level
+    # and in class bodies, whose calls belong to no function) and the
+    # "Outer.Inner." prefix of the enclosing classes, extended once per class.
+    stack = [(tree, None, "")]
+    pop, push = stack.pop, stack.append
+    while stack:
+        node, slot, classes = pop()
+        kind = type(node)
+        if kind is Call:
+            func = node.func
+            if slot is not None and type(func) is Attribute:   # ast node classes are never subclassed
+                attr = func.attr
+                if attr is up_name:
+                    slot[0] += 1
+                elif attr is down_name:
+                    slot[0] -= 1
+        elif kind is ClassDef:
+            slot, classes = None, f"{classes}{node.name}."
+        elif kind in functions:
+            # a function (decorators included) whose text never names up/down
+            # can hold no matching call, not even in nested defs: skip it whole
+            first = node.decorator_list[0].lineno if node.decorator_list else node.lineno
+            if not pattern.search(src, line_starts[first - 1], line_starts[node.end_lineno]):
+                continue
+            slot = [0, node, classes]
+            report.append(slot)
+        # ast.iter_child_nodes, inlined: it is a generator call per node
+        if slot is None:
+            fields = bodies_of.get(kind)
+            if fields is None:
+                fields = bodies_of[kind] = tuple(f for f in kind._fields if f in _AST_BODY_FIELDS)
+        else:
+            fields = fields_of.get(kind)
+            if fields is None:
+                fields = fields_of[kind] = tuple(f for f in kind._fields if f not in _AST_LEAF_FIELDS)
+        for name in fields:
+            value = getattr(node, name, None)
+            if type(value) is list:
+                for child in value:
+                    if isinstance(child, AST):
+                        push((child, slot, classes))
+            elif isinstance(value, AST):
+                push((value, slot, classes))
+
+    # record only the unbalanced ones, named and put back in source order
+    # (the stack hands out functions in no particular order)
+    unbalanced = [slot for slot in report if slot[0]]
+    unbalanced.sort(key=lambda slot: (slot[1].lineno, slot[1].col_offset))
+    return [(classes + node.name, delta) for delta, node, classes in unbalanced]
 
 
 
@@ -1,4 +1,4 @@
-import math, os, ast, shutil
+import math, os, ast, shutil, re, sys
 from typing import List, Tuple
 from .log import Log
 global log
@@ -1016,15 +1016,6 @@ class PeekPy: # Code Indexer
         else:
             print(output)
 
-    # ======= Post-Processing=======
-    def _finalize_output(self, return_output):
-            self.logger.down()
-            output = self.logger.get_output()
-            if return_output:
-                return output
-            else:
-                print(output)
-
     def set_filters(self, filters = None):
         if filters is None:
             filters = self.logger.filters
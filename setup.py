@@ -46,10 +46,7 @@ setup(
         "Topic :: System :: Logging",
     ],
     python_requires=">=3.8",
-    install_requires=[
-        "numpy>=1.20.0",
-        "pandas>=1.3.0",
-    ],
+    install_requires=[],
     extras_require={
         "full": [
             "pygments>=2.10.0",
@@ -0,0 +1,10 @@
+import PeekPy
+
+
+def test_namespace_exposes_only_public_names():
+    names = dir(PeekPy)
+    for helper in ("os", "sys", "warnings", "lru_cache", "MappingProxyType", "NamedTuple"):
+        assert helper not in names
+        assert not hasattr(PeekPy, helper)
+    assert set(PeekPy.__all__) <= set(names)
+    assert not [name for name in names if name.startswith("_") and not name.endswith("__")]
@@ -0,0 +1,117 @@
+import io
+import sys
+import threading
+
+from PeekPy.log import Log, TreeRenderer
+
+
+def test_batch_holds_back_only_its_own_thread(monkeypatch):
+    out = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", out)
+    log = Log()
+    entered, released = threading.Event(), threading.Event()
+
+    def batching():
+        with log.batch():
+            log("from batch")
+            entered.set()
+            released.wait(5)
+
+    worker = threading.Thread(target=batching)
+    worker.start()
+    assert entered.wait(5)
+    log("from other thread")
+    # the other thread's line is out while the batch is still open
+    assert "from other thread" in out.getvalue()
+    assert "from batch" not in out.getvalue()
+    released.set()
+    worker.join(5)
+    text = out.getvalue()
+    assert text.index("from other thread") < text.index("from batch")
+
+
+def test_concurrent_logs_are_written_once(monkeypatch):
+    out = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", out)
+    log = Log()
+
+    def worker():
+        for i in range(2000):
+            log(f"line {i}")
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    log.flush()
+    assert out.getvalue().count("line ") == 16000
+
+
+def _item_lines(items, max_depth=None, show_types=False):
+    lines, width = TreeRenderer(Log())._generate_lines("item", items, show_types, max_depth)
+    assert width == max(map(len, lines))
+    return lines
+
+
+def test_tree_item_keeps_the_two_level_layout():
+    assert _item_lines({"a": 1, "b": [2, 3], "c": "x"}) == [
+        " ─┬○ Item:",
+        "  ╰─┬─ a = 1",
+        "  │ ╰─┬─ 2",
+        "  │   ╰─ 3",
+        "    ╰─ c = x",
+        "",
+    ]
+    assert _item_lines([1, "two", 3.0]) == [
+        " ─┬○ Item:",
+        "  ╰┬─ 1",
+        "   ├─ two",
+        "   ╰─ 3.0",
+        "",
+    ]
+    assert _item_lines(5) == [" ─┬○ Item:", " ╰─ item: 5", ""]
+
+
+def test_tree_item_walks_nested_containers():
+    assert _item_lines({"x": 1, "y": {"z": [1, {"q": 2}]}, "l": [1, {"a": 1}]}) == [
+        " ─┬○ Item:",
+        "  ╰─┬─ x = 1",
+        "    ├─ y:",
+        "    │    ╰─ z:",
+        "    │       ╰─┬─ 1",
+        "    │         ╰─ [1]:",
+        "    │              ╰─ q = 2",
+        "    ╰─┬─ 1",
+        "      ╰─ [1]:",
+        "           ╰─ a = 1",
+        "",
+    ]
+
+
+def test_tree_item_elides_levels_past_max_depth():
+    data = {"x": 1, "y": {"z": [1, 2]}, "l": [1, [2, 3]]}
+    assert _item_lines(data, max_depth=0) == [" ─┬○ Item:", " ╰─ item: …", ""]
+    assert _item_lines(data, max_depth=1) == [
+        " ─┬○ Item:",
+        "  ╰─┬─ x = 1",
+        "    ├─ y: …",
+        "    ╰─ l: …",
+        "",
+    ]
+    assert _item_lines(data, max_depth=2) == [
+        " ─┬○ Item:",
+        "  ╰─┬─ x = 1",
+        "    ├─ y:",
+        "    │    ╰─ z: …",
+        "    ╰─┬─ 1",
+        "      ╰─ [1]: …",
+        "",
+    ]
+
+
+def test_tree_item_handles_deep_nesting():
+    data = {"x": 1}
+    for _ in range(3 * sys.getrecursionlimit()):
+        data = {"a": data, "b": 0}
+    assert len(_item_lines(data)) > 6 * sys.getrecursionlimit()
@@ -0,0 +1,18 @@
+import pytest
+
+from PeekPy import logSingleton
+from PeekPy.logSingleton import LogSingleton, get_shared_log
+
+
+def test_log_singleton_old_methods_still_work():
+    singleton = LogSingleton()
+    with pytest.deprecated_call():
+        assert singleton.get_log() is get_shared_log()
+    with pytest.deprecated_call():
+        assert singleton.set_debug_level(2) is get_shared_log()
+    assert get_shared_log().DEBUG == 2
+    old = get_shared_log()
+    with pytest.deprecated_call():
+        fresh = singleton.reset_log()
+    assert fresh is logSingleton.log is get_shared_log()
+    assert fresh is not old